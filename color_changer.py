@@ -1,7 +1,14 @@
-from docx import Document
 from lxml import etree
 import os
+import copy
+import itertools
 import json
+import posixpath
+import shutil
+import struct
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 
 # Color palettes configuration
 COLOR_PALETTES = {
@@ -262,6 +269,102 @@ COLOR_PALETTES = {
     }
 }
 
+# DrawingML namespace and the Clark-notation tags built from it
+NS_A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+_CLR_SCHEME_TAG = f'{{{NS_A}}}clrScheme'
+_SRGB_CLR_TAG = f'{{{NS_A}}}srgbClr'
+
+# Flattened views of COLOR_PALETTES: ordered (element, rgb) pairs and display names
+_PALETTE_COLORS = {
+    key: tuple(palette["colors"].items()) for key, palette in COLOR_PALETTES.items()
+}
+_PALETTE_DISPLAY_NAMES = {
+    key: palette["name"] for key, palette in COLOR_PALETTES.items()
+}
+
+def _build_palette_fragment(display_name, colors):
+    """Serialize a palette as a ready-to-insert <a:clrScheme> element."""
+    SubElement = etree.SubElement
+    color_scheme = etree.Element(_CLR_SCHEME_TAG, nsmap={'a': NS_A}, name=display_name)
+    for color_name, rgb_value in colors:
+        color_elem = SubElement(color_scheme, f'{{{NS_A}}}{color_name}')
+        SubElement(color_elem, _SRGB_CLR_TAG, val=rgb_value)
+    return etree.tostring(color_scheme, method='xml')
+
+# Palettes are fixed at import time, so each <a:clrScheme> is serialized once
+_PALETTE_FRAGMENTS = {
+    key: _build_palette_fragment(_PALETTE_DISPLAY_NAMES[key], colors)
+    for key, colors in _PALETTE_COLORS.items()
+}
+
+_PALETTE_NAMES_STR = ', '.join(COLOR_PALETTES)
+
+# Local file header field indexes within zipfile.structFileHeader
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+_FLAG_DATA_DESCRIPTOR = 0x08
+_COPY_BUFFER_SIZE = 1 << 20
+
+_THEME_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme'
+_DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+_DEFAULT_THEME_PART = 'word/theme/theme1.xml'
+
+# Reused across documents; theme parts never need DTDs, entities or network access
+_THEME_PARSER = etree.XMLParser(
+    resolve_entities=False,
+    no_network=True,
+    collect_ids=False,
+    huge_tree=False
+)
+
+# clrScheme always sits directly under themeElements, so no descendant scan is needed
+_CLR_SCHEME_XPATH = etree.XPath(
+    'a:themeElements/a:clrScheme',
+    namespaces={'a': NS_A}
+)
+
+def _find_theme_part(src):
+    """Resolve the theme part name from the main document relationships."""
+    try:
+        rels = etree.fromstring(src.read(_DOCUMENT_RELS_PART), _THEME_PARSER)
+    except KeyError:
+        return _DEFAULT_THEME_PART
+    
+    for rel in rels:
+        if rel.get('Type') == _THEME_REL_TYPE:
+            target = rel.get('Target', '')
+            if target.startswith('/'):
+                return target.lstrip('/')
+            return posixpath.normpath(posixpath.join('word', target))
+    
+    return _DEFAULT_THEME_PART
+
+def _copy_raw_entry(src, dst, info):
+    """Copy an archive entry's compressed bytes verbatim, without recompressing."""
+    # Skip past the source local header to the start of the compressed data
+    src.fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, src.fp.read(zipfile.sizeFileHeader))
+    src.fp.seek(header[_FH_FILENAME_LENGTH] + header[_FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+    
+    # Sizes and CRC are known up front, so no trailing data descriptor is needed
+    out_info = copy.copy(info)
+    out_info.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    out_info.header_offset = dst.fp.tell()
+    dst.fp.write(out_info.FileHeader())
+    
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = src.fp.read(min(remaining, _COPY_BUFFER_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        dst.fp.write(chunk)
+        remaining -= len(chunk)
+    
+    # Register the entry so it lands in the central directory on close
+    dst.filelist.append(out_info)
+    dst.NameToInfo[out_info.filename] = out_info
+    dst.start_dir = dst.fp.tell()
+
 def change_theme_colors(docx_path, palette_name):
     """
     Change the theme colors of a Word document to a specified palette.
@@ -269,51 +372,75 @@ def change_theme_colors(docx_path, palette_name):
     Args:
         docx_path: Path to the .docx file
         palette_name: Name of the color palette to apply
-    """
-    if palette_name not in COLOR_PALETTES:
-        raise ValueError(f"Unknown palette: {palette_name}. Available: {', '.join(COLOR_PALETTES.keys())}")
-    
-    palette = COLOR_PALETTES[palette_name]["colors"]
-    
-    doc = Document(docx_path)
     
-    # Access the theme part
-    theme_part = doc.part.part_related_by(
-        'http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme'
-    )
+    Returns:
+        True if the document was rewritten, False if it was left unchanged
+    """
+    try:
+        fragment = _PALETTE_FRAGMENTS[palette_name]
+    except KeyError:
+        raise ValueError(f"Unknown palette: {palette_name}. Available: {_PALETTE_NAMES_STR}") from None
     
-    # Get the theme XML
-    theme_xml = theme_part.blob
-    theme_element = etree.fromstring(theme_xml)
+    tmp_path = None
     
-    # Define namespaces
-    namespaces = {
-        'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'
-    }
+    with zipfile.ZipFile(docx_path, 'r') as src:
+        theme_part_name = _find_theme_part(src)
+        
+        # Get the theme XML
+        theme_element = etree.fromstring(src.read(theme_part_name), _THEME_PARSER)
+        
+        # Find the color scheme element
+        matches = _CLR_SCHEME_XPATH(theme_element)
+        color_scheme = matches[0] if matches else None
+        
+        # Leave the file untouched if it already carries this exact palette
+        if color_scheme is not None and etree.tostring(color_scheme, with_tail=False) != fragment:
+            # Swap in the precomputed color scheme for this palette
+            color_scheme.getparent().replace(
+                color_scheme,
+                etree.fromstring(fragment, _THEME_PARSER)
+            )
+            
+            # Rewrite only the theme part into a sibling temp file, copying every other entry across
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(docx_path)))
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file, \
+                        zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as dst:
+                    for info in src.infolist():
+                        if info.filename == theme_part_name:
+                            # Serialize straight into the archive stream, no intermediate blob
+                            with dst.open(copy.copy(info), 'w') as wf:
+                                etree.ElementTree(theme_element).write(
+                                    wf, xml_declaration=True, encoding='UTF-8', standalone=True
+                                )
+                        else:
+                            _copy_raw_entry(src, dst, info)
+            except BaseException:
+                # Never leave a half-written archive behind
+                os.remove(tmp_path)
+                raise
     
-    # Find the color scheme element
-    color_scheme = theme_element.find('.//a:clrScheme', namespaces)
+    # Replace only after the source archive is closed (required on Windows);
+    # the rename is atomic, so a crash can't leave a truncated document
+    if tmp_path is None:
+        if color_scheme is None:
+            print(f"- No theme color scheme in {docx_path}, unchanged")
+        else:
+            print(f"- {docx_path} already uses '{_PALETTE_DISPLAY_NAMES[palette_name]}', unchanged")
+        return False
     
-    if color_scheme is not None:
-        # Update each color in the scheme
-        for color_name, rgb_value in palette.items():
-            color_elem = color_scheme.find(f'.//a:{color_name}', namespaces)
-            if color_elem is not None:
-                # Clear existing color definitions
-                color_elem.clear()
-                # Set new RGB color
-                srgb_clr = etree.SubElement(
-                    color_elem,
-                    f'{{{namespaces["a"]}}}srgbClr',
-                    val=rgb_value
-                )
-        
-        # Update the theme part with modified XML
-        theme_part._blob = etree.tostring(theme_element, xml_declaration=True, encoding='UTF-8')
+    shutil.copymode(docx_path, tmp_path)
+    os.replace(tmp_path, docx_path)
     
-    # Save the modified document
-    doc.save(docx_path)
-    print(f"✓ Applied '{COLOR_PALETTES[palette_name]['name']}' theme to: {docx_path}")
+    print(f"✓ Applied '{_PALETTE_DISPLAY_NAMES[palette_name]}' theme to: {docx_path}")
+    return True
+
+def _change_one(filepath, palette):
+    """Apply a palette to one file, returning (rewritten, error message on failure)."""
+    try:
+        return change_theme_colors(filepath, palette), None
+    except Exception as e:
+        return False, str(e)
 
 def process_directory(directory='.', palette='red'):
     """
@@ -324,24 +451,33 @@ def process_directory(directory='.', palette='red'):
         palette: Name of the color palette to apply (default: 'red')
     """
     processed = 0
+    unchanged = 0
     errors = 0
     
-    print(f"Using palette: {COLOR_PALETTES[palette]['name']}")
+    print(f"Using palette: {_PALETTE_DISPLAY_NAMES[palette]}")
     print(f"Processing directory: {directory}\n")
     
     # Get all .docx files in the directory
-    for filename in os.listdir(directory):
-        if filename.endswith('.docx') and not filename.startswith('~$'):
-            filepath = os.path.join(directory, filename)
-            try:
-                change_theme_colors(filepath, palette)
-                processed += 1
-            except Exception as e:
-                print(f"✗ Error processing {filename}: {str(e)}")
+    with os.scandir(directory) as entries:
+        files = [
+            entry.path for entry in entries
+            if entry.is_file() and entry.name.endswith('.docx') and not entry.name.startswith('~$')
+        ]
+    
+    # Files are independent, so fan them out across CPU cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_change_one, files, itertools.repeat(palette), chunksize=4)
+        for filepath, (changed, error) in zip(files, results):
+            if error is not None:
+                print(f"✗ Error processing {os.path.basename(filepath)}: {error}")
                 errors += 1
+            elif changed:
+                processed += 1
+            else:
+                unchanged += 1
     
     print(f"\n{'='*50}")
-    print(f"Summary: {processed} documents updated, {errors} errors")
+    print(f"Summary: {processed} documents updated, {unchanged} unchanged, {errors} errors")
     print(f"{'='*50}")
 
 def list_palettes():
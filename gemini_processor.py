@@ -6,12 +6,53 @@ Handles communication with Google's Gemini API for AI-powered note processing.
 
 import os
 import json
+import mmap
 import time
+import random
+import threading
+import asyncio
+import importlib.util
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # Fall back to the standard library when orjson isn't installed
+    _dumps = lambda obj: json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 multiplexing needs the optional h2 package alongside httpx
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_logger = logging.getLogger(__name__)
+
+# Configure logging once at import rather than on every instantiation
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+
+# Upper bound on in-flight requests for batch processing
+BATCH_CONCURRENCY = 8
+
+# Process-wide cap on concurrent synchronous requests, shared by all instances
+_REQUEST_SLOTS = threading.BoundedSemaphore(BATCH_CONCURRENCY)
+
+# Ceiling for a single retry wait
+MAX_BACKOFF_SECONDS = 60
+
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models"
 
 
 @dataclass
@@ -43,16 +84,24 @@ class GeminiProcessor:
                     with open(api_key_file, 'r', encoding='utf-8') as f:
                         self.api_key = f.read().strip()
                 except Exception as e:
-                    logging.warning(f"Could not read API key from file: {e}")
+                    _logger.warning(f"Could not read API key from file: {e}")
         
         if not self.api_key:
             # We don't raise here to allow instantiation for testing/configuration
             # but methods requiring API key will fail
             pass
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        # Persistent session so repeated requests reuse the same TLS connection
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+        self._generate_url = f"{GEMINI_API_BASE}/{self.config.model}:generateContent"
+        self._stream_url = f"{GEMINI_API_BASE}/{self.config.model}:streamGenerateContent"
+        
+        self.logger = _logger
     
     def test_connection(self) -> Dict[str, Any]:
         """Test the Gemini API connection."""
@@ -66,8 +115,6 @@ class GeminiProcessor:
             self.logger.info("Testing Gemini API connection...")
             
             # Simple test request
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.config.model}:generateContent?key={self.api_key}"
-            
             payload = {
                 "contents": [{
                     "parts": [{"text": "Say 'Hello' if you can read this."}]
@@ -78,15 +125,15 @@ class GeminiProcessor:
                 }
             }
             
-            response = requests.post(
-                url,
-                headers={"Content-Type": "application/json"},
-                json=payload,
+            response = self._session.post(
+                self._generate_url,
+                params={"key": self.api_key},
+                data=_dumps(payload),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 self.logger.info("Gemini API connection successful")
                 
                 # Extract text
@@ -134,72 +181,35 @@ class GeminiProcessor:
 
             self.logger.info(f"Processing transcript for subject: {subject} with Gemini")
             
-            # Prepare the prompt using pre_prompt from config
-            # We don't use a hardcoded system prompt to avoid duplication with pre_prompt.txt
-            full_prompt = f"{self.config.pre_prompt}\n\nTranscript:\n{transcript_text}"
-            
-            if subject and not self.config.pre_prompt:
-                 # Fallback if pre_prompt is missing but we have subject
-                 full_prompt = f"Please create detailed notes for this {subject} class transcript:\n\n{transcript_text}"
-            
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.config.model}:generateContent?key={self.api_key}"
-            
-            payload = {
-                "contents": [{
-                    "parts": [{"text": full_prompt}]
-                }],
-                "generationConfig": {
-                    "temperature": self.config.temperature,
-                    "maxOutputTokens": self.config.max_tokens
-                }
-            }
+            payload = self._build_payload(transcript_text, subject)
             
             # Make request with retries
             for attempt in range(self.config.max_retries):
                 try:
-                    response = requests.post(
-                        url,
-                        headers={"Content-Type": "application/json"},
-                        json=payload,
-                        timeout=self.config.timeout
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        
-                        # Extract response content
-                        content = ""
-                        try:
-                            content = result['candidates'][0]['content']['parts'][0]['text']
-                        except (KeyError, IndexError):
-                            raise ValueError("Unexpected response structure from Gemini API")
+                    # Hold a process-wide slot only while the connection is in use
+                    with _REQUEST_SLOTS:
+                        response = self._session.post(
+                            self._stream_url,
+                            params={"alt": "sse", "key": self.api_key},
+                            data=_dumps(payload),
+                            timeout=self.config.timeout,
+                            stream=True
+                        )
                         
-                        if not content:
-                            raise ValueError("Empty content in API response")
+                        if response.status_code == 200:
+                            with response:
+                                return self._parse_response(self._collect_stream(response))
                         
-                        # Extract token usage (if available, Gemini API format varies)
-                        # usageMetadata: { promptTokenCount: 10, candidatesTokenCount: 100, totalTokenCount: 110 }
-                        usage = result.get("usageMetadata", {})
-                        tokens_used = usage.get("totalTokenCount", 0)
-                        
-                        self.logger.info(f"Successfully processed transcript using {tokens_used} tokens")
-                        
-                        return {
-                            "success": True,
-                            "notes": content,
-                            "tokens_used": tokens_used,
-                            "model": self.config.model,
-                            "usage": usage
-                        }
+                        error_body = response.text
                     
-                    elif response.status_code == 429:  # Rate limited
-                        wait_time = self.config.retry_delay * (2 ** attempt)
-                        self.logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}")
+                    if response.status_code == 429:  # Rate limited
+                        wait_time = self._backoff_delay(attempt)
+                        self.logger.warning(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}")
                         time.sleep(wait_time)
                         continue
                     
                     else:
-                        error_msg = f"HTTP {response.status_code}: {response.text}"
+                        error_msg = f"HTTP {response.status_code}: {error_body}"
                         self.logger.error(f"API request failed: {error_msg}")
                         # Don't retry for client errors unless 429
                         if 400 <= response.status_code < 500 and response.status_code != 429:
@@ -210,7 +220,7 @@ class GeminiProcessor:
                         
                         # Retry for 500s
                         if attempt < self.config.max_retries - 1:
-                            time.sleep(self.config.retry_delay)
+                            time.sleep(self._backoff_delay(attempt))
                             continue
                         return {
                             "success": False,
@@ -220,7 +230,7 @@ class GeminiProcessor:
                 except requests.exceptions.Timeout:
                     if attempt < self.config.max_retries - 1:
                         self.logger.warning(f"Request timeout, retrying... (attempt {attempt + 1})")
-                        time.sleep(self.config.retry_delay)
+                        time.sleep(self._backoff_delay(attempt))
                         continue
                     else:
                         return {
@@ -231,7 +241,7 @@ class GeminiProcessor:
                 except requests.exceptions.RequestException as e:
                     if attempt < self.config.max_retries - 1:
                         self.logger.warning(f"Network error, retrying... (attempt {attempt + 1}): {e}")
-                        time.sleep(self.config.retry_delay)
+                        time.sleep(self._backoff_delay(attempt))
                         continue
                     else:
                         return {
@@ -254,51 +264,15 @@ class GeminiProcessor:
     def process_transcript_file(self, transcript_path: str, output_path: str, subject: str = "") -> Dict[str, Any]:
         """Process transcript file and save notes to output file."""
         try:
-            # Read transcript file
-            transcript_file = Path(transcript_path)
-            if not transcript_file.exists():
-                return {
-                    "success": False,
-                    "error": f"Transcript file not found: {transcript_path}"
-                }
-            
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                transcript_text = f.read().strip()
-            
-            if not transcript_text:
-                return {
-                    "success": False,
-                    "error": "Transcript file is empty"
-                }
+            transcript_text, error = self._read_transcript_file(transcript_path)
+            if error:
+                return error
             
             # Process transcript
             result = self.process_transcript(transcript_text, subject)
             
             if result["success"]:
-                # Save notes to file
-                output_file = Path(output_path)
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Create formatted notes content
-                notes_content = self._format_notes_output(
-                    result["notes"],
-                    subject,
-                    transcript_file.name,
-                    result.get("tokens_used", 0),
-                    result.get("model", self.config.model)
-                )
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(notes_content)
-                
-                self.logger.info(f"Notes saved to: {output_path}")
-                
-                return {
-                    "success": True,
-                    "output_path": output_path,
-                    "tokens_used": result.get("tokens_used", 0),
-                    "model": result.get("model", self.config.model)
-                }
+                return self._write_notes_file(result, output_path, subject, os.path.basename(transcript_path))
             else:
                 return result
         
@@ -309,7 +283,263 @@ class GeminiProcessor:
                 "error": f"File processing error: {str(e)}"
             }
     
+    def process_transcript_files(self, files: List[Tuple[str, str]], subject: str = "") -> List[Dict[str, Any]]:
+        """Process several (transcript_path, output_path) pairs concurrently."""
+        return asyncio.run(self.process_transcript_files_async(files, subject))
+    
+    async def process_transcript_files_async(self, files: List[Tuple[str, str]], subject: str = "") -> List[Dict[str, Any]]:
+        """Process several (transcript_path, output_path) pairs with bounded concurrency."""
+        if httpx is None:
+            return [{
+                "success": False,
+                "error": "httpx is required for batch processing (pip install httpx)"
+            } for _ in files]
+        
+        if not self.api_key:
+            return [{
+                "success": False,
+                "error": "Gemini API key not found"
+            } for _ in files]
+        
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        limits = httpx.Limits(max_connections=BATCH_CONCURRENCY)
+        
+        async with httpx.AsyncClient(http2=_HTTP2_AVAILABLE, timeout=self.config.timeout, limits=limits) as client:
+            
+            async def process_one(transcript_path: str, output_path: str) -> Dict[str, Any]:
+                try:
+                    transcript_text, error = self._read_transcript_file(transcript_path)
+                    if error:
+                        return error
+                    
+                    result = await self._process_transcript_async(client, semaphore, transcript_text, subject)
+                    
+                    if result["success"]:
+                        return self._write_notes_file(result, output_path, subject, os.path.basename(transcript_path))
+                    return result
+                
+                except Exception as e:
+                    self.logger.error(f"Error processing transcript file: {e}")
+                    return {
+                        "success": False,
+                        "error": f"File processing error: {str(e)}"
+                    }
+            
+            return list(await asyncio.gather(*(process_one(t, o) for t, o in files)))
+    
+    async def _process_transcript_async(self, client, semaphore: asyncio.Semaphore,
+                                        transcript_text: str, subject: str = "") -> Dict[str, Any]:
+        """Async counterpart of process_transcript used by batch processing."""
+        try:
+            self.logger.info(f"Processing transcript for subject: {subject} with Gemini")
+            
+            body = _dumps(self._build_payload(transcript_text, subject))
+            
+            # Make request with retries
+            for attempt in range(self.config.max_retries):
+                try:
+                    async with semaphore:
+                        response = await client.post(
+                            self._generate_url,
+                            params={"key": self.api_key},
+                            content=body,
+                            headers={"Content-Type": "application/json"}
+                        )
+                    
+                    if response.status_code == 200:
+                        return self._parse_response(_loads(response.content))
+                    
+                    elif response.status_code == 429:  # Rate limited
+                        wait_time = self._backoff_delay(attempt)
+                        self.logger.warning(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}")
+                        await asyncio.sleep(wait_time)
+                        continue
+                    
+                    else:
+                        error_msg = f"HTTP {response.status_code}: {response.text}"
+                        self.logger.error(f"API request failed: {error_msg}")
+                        # Don't retry for client errors unless 429
+                        if 400 <= response.status_code < 500:
+                            return {
+                                "success": False,
+                                "error": error_msg
+                            }
+                        
+                        # Retry for 500s
+                        if attempt < self.config.max_retries - 1:
+                            await asyncio.sleep(self._backoff_delay(attempt))
+                            continue
+                        return {
+                            "success": False,
+                            "error": error_msg
+                        }
+                
+                except httpx.TimeoutException:
+                    if attempt < self.config.max_retries - 1:
+                        self.logger.warning(f"Request timeout, retrying... (attempt {attempt + 1})")
+                        await asyncio.sleep(self._backoff_delay(attempt))
+                        continue
+                    else:
+                        return {
+                            "success": False,
+                            "error": "Request timeout after all retries"
+                        }
+                
+                except httpx.HTTPError as e:
+                    if attempt < self.config.max_retries - 1:
+                        self.logger.warning(f"Network error, retrying... (attempt {attempt + 1}): {e}")
+                        await asyncio.sleep(self._backoff_delay(attempt))
+                        continue
+                    else:
+                        return {
+                            "success": False,
+                            "error": f"Network error: {str(e)}"
+                        }
+            
+            return {
+                "success": False,
+                "error": "All retry attempts failed"
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error processing transcript: {e}")
+            return {
+                "success": False,
+                "error": f"Processing error: {str(e)}"
+            }
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff so concurrent retries don't stampede."""
+        return min(MAX_BACKOFF_SECONDS, random.uniform(0, self.config.retry_delay * (2 ** attempt)))
     
+    def _build_payload(self, transcript_text: str, subject: str = "") -> Dict[str, Any]:
+        """Build the generateContent request body for a transcript."""
+        # Prepare the prompt using pre_prompt from config
+        # We don't use a hardcoded system prompt to avoid duplication with pre_prompt.txt
+        full_prompt = f"{self.config.pre_prompt}\n\nTranscript:\n{transcript_text}"
+        
+        if subject and not self.config.pre_prompt:
+             # Fallback if pre_prompt is missing but we have subject
+             full_prompt = f"Please create detailed notes for this {subject} class transcript:\n\n{transcript_text}"
+        
+        return {
+            "contents": [{
+                "parts": [{"text": full_prompt}]
+            }],
+            "generationConfig": {
+                "temperature": self.config.temperature,
+                "maxOutputTokens": self.config.max_tokens
+            }
+        }
+    
+    def _parse_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract notes and token usage from a generateContent response."""
+        # Extract response content
+        content = ""
+        try:
+            content = result['candidates'][0]['content']['parts'][0]['text']
+        except (KeyError, IndexError):
+            raise ValueError("Unexpected response structure from Gemini API")
+        
+        if not content:
+            raise ValueError("Empty content in API response")
+        
+        # Extract token usage (if available, Gemini API format varies)
+        # usageMetadata: { promptTokenCount: 10, candidatesTokenCount: 100, totalTokenCount: 110 }
+        usage = result.get("usageMetadata", {})
+        tokens_used = usage.get("totalTokenCount", 0)
+        
+        self.logger.info(f"Successfully processed transcript using {tokens_used} tokens")
+        
+        return {
+            "success": True,
+            "notes": content,
+            "tokens_used": tokens_used,
+            "model": self.config.model,
+            "usage": usage
+        }
+    
+    def _collect_stream(self, response) -> Dict[str, Any]:
+        """Merge server-sent streamGenerateContent chunks into a single response."""
+        text_parts = []
+        usage = {}
+        saw_candidate = False
+        
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            
+            chunk = _loads(line[6:])
+            for candidate in chunk.get("candidates", [])[:1]:
+                saw_candidate = True
+                for part in candidate.get("content", {}).get("parts", []):
+                    text_parts.append(part.get("text", ""))
+            
+            # Token usage is reported cumulatively, so the last chunk wins
+            usage = chunk.get("usageMetadata", usage)
+        
+        if not saw_candidate:
+            return {"usageMetadata": usage}
+        
+        return {
+            "candidates": [{"content": {"parts": [{"text": "".join(text_parts)}]}}],
+            "usageMetadata": usage
+        }
+    
+    def _read_transcript_file(self, transcript_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Read a transcript, returning (text, error_result)."""
+        # Decode straight out of a read-only mapping to avoid an extra bytes copy
+        try:
+            with open(transcript_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    transcript_text = ""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        transcript_text = str(mm, 'utf-8').strip()
+        except FileNotFoundError:
+            return "", {
+                "success": False,
+                "error": f"Transcript file not found: {transcript_path}"
+            }
+        
+        # Match text-mode newline handling for transcripts saved on Windows
+        if '\r' in transcript_text:
+            transcript_text = transcript_text.replace('\r\n', '\n')
+        
+        if not transcript_text:
+            return "", {
+                "success": False,
+                "error": "Transcript file is empty"
+            }
+        
+        return transcript_text, None
+    
+    def _write_notes_file(self, result: Dict[str, Any], output_path: str, subject: str, source_name: str) -> Dict[str, Any]:
+        """Save processed notes to output_path and return the file-level result."""
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        
+        # Create formatted notes content
+        notes_content = self._format_notes_output(
+            result["notes"],
+            subject,
+            source_name,
+            result.get("tokens_used", 0),
+            result.get("model", self.config.model)
+        )
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(notes_content)
+        
+        self.logger.info(f"Notes saved to: {output_path}")
+        
+        return {
+            "success": True,
+            "output_path": output_path,
+            "tokens_used": result.get("tokens_used", 0),
+            "model": result.get("model", self.config.model)
+        }
     
     def _format_notes_output(self, notes: str, subject: str, filename: str, tokens_used: int, model: str) -> str:
         """Format the notes output with metadata."""
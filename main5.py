@@ -5,22 +5,43 @@ Orchestrates recording detection, transcription, note processing, and document c
 """
 
 import os
+import re
 import sys
 import json
+import functools
+import mmap
 import time
+import platform
+import subprocess
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import queue
 import logging
-from dataclasses import dataclass, asdict, fields
+import logging.handlers
+from dataclasses import dataclass, fields
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchfiles import watch, Change
 from word_document_manager import WordDocumentManager, WordFormattingConfig
 
+try:
+    import orjson
+    _config_dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _config_loads = orjson.loads
+except ImportError:
+    # Fall back to the standard library when orjson isn't installed
+    _config_dumps = lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    _config_loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    # _match_subject falls back to a compiled regex alternation
+    ahocorasick = None
+
 try:
     from transcriber import AssemblyAITranscriber, TranscriptionConfig
     from openrouter_processor import OpenRouterProcessor, NoteProcessingConfig
@@ -32,6 +53,136 @@ except ImportError as e:
     sys.exit(1)
 
 
+_THINK_RE = re.compile(r'<think\s*>.*?</think\s*>', re.DOTALL | re.IGNORECASE)
+# Bytes twin of _THINK_RE for cleaning saved notes without decoding them; the
+# tags are ASCII, so they can't match inside a multi-byte UTF-8 sequence
+_THINK_RE_B = re.compile(rb'<think\s*>.*?</think\s*>', re.DOTALL | re.IGNORECASE)
+# Cheap pre-check on the raw notes bytes before running _THINK_RE_B
+_THINK_MARK_RE = re.compile(rb'<think', re.IGNORECASE)
+
+# Host OS, looked up once for the "open in file manager/editor" actions
+_SYSTEM = platform.system()
+
+# How long a resolved combined-notes document location stays valid
+SUBJECT_DOC_CACHE_TTL = 5.0
+
+# Reprocessing rows added to the tree at a time as the user scrolls down
+REPROCESS_PAGE_SIZE = 100
+
+# Reprocessing tree "Status" column, keyed by (has_transcript, has_notes)
+_REPROCESS_STATUS = {
+    (True, True): "Completed",
+    (True, False): "Has Transcript Only",
+    (False, True): "Ready",
+    (False, False): "Ready",
+}
+
+# get_task_progress text for statuses that don't depend on the task's details
+_PROGRESS_TEXT = {
+    "transcript_only": "📝 Has transcript, needs notes",
+    "queued_notes": "⏳ Queued for notes generation",
+    "queued_transcript": "⏳ Queued for transcript generation",
+    "transcribing": "🎵 Transcribing audio...",
+    "processing_notes": "📝 Generating notes...",
+    "queued": "⏳ Queued for processing",
+    "pending": "⏳ Waiting to start",
+}
+
+# Quiet period before a slider's value label is redrawn while dragging
+LABEL_DEBOUNCE_MS = 50
+
+
+@functools.lru_cache(maxsize=8)
+def _subject_pattern(subjects: Tuple[str, ...]) -> "re.Pattern":
+    """Case-insensitive matcher reporting, at each position, the earliest-listed subject found there."""
+    alternatives = "|".join(f"(?P<s{i}>{re.escape(s)})" for i, s in enumerate(subjects))
+    return re.compile(f"(?={alternatives})", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def _subject_automaton(subjects: Tuple[str, ...]):
+    """Aho-Corasick automaton mapping each lower-cased subject to its earliest index."""
+    automaton = ahocorasick.Automaton()
+    # Added last-to-first so a repeated name keeps its earliest index
+    for i in range(len(subjects) - 1, -1, -1):
+        automaton.add_word(subjects[i].lower(), i)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_subject(filename: str, subjects: Tuple[str, ...]) -> Optional[str]:
+    """Return the first subject, in configured order, whose name occurs in filename.
+
+    Memoized, so rescanning a directory doesn't rematch the same filenames.
+    """
+    if not subjects:
+        return None
+    if ahocorasick is not None and all(subjects):
+        # One pass over the filename regardless of how many subjects there are
+        best = min((i for _, i in _subject_automaton(subjects).iter(filename.lower())), default=None)
+        return None if best is None else subjects[best]
+    best = None
+    for match in _subject_pattern(subjects).finditer(filename):
+        index = int(match.lastgroup[1:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return None if best is None else subjects[best]
+
+
+# A new file counts as fully written once its size and mtime have held still this long
+SETTLE_QUIET_SECONDS = 2.0
+# How often files waiting to settle are re-checked
+SETTLE_POLL_SECONDS = 0.5
+# A file still changing after this long is dropped rather than tracked forever
+SETTLE_DEADLINE_SECONDS = 30 * 60
+
+
+def _doc_candidates(subject: str) -> Iterator[Path]:
+    """Locations searched, in order, for a subject's combined notes document."""
+    name = f"{subject}_combined_notes.docx"
+    # Location 1: .\Appunti Completi\{subject}\{subject}_combined_notes.docx
+    yield Path("Appunti Completi", subject, name)
+    # Location 2: .\{subject}\Appunti Completi\{subject}_combined_notes.docx
+    yield Path(subject, "Appunti Completi", name)
+    # Location 3: Current directory
+    yield Path(name)
+    # Location 4: Subject directory
+    yield Path(subject, name)
+
+
+def _dir_entries(parent: Path, dir_index: Dict[Path, frozenset]) -> frozenset:
+    """Names in parent (normcased), scanned once per dir_index."""
+    entries = dir_index.get(parent)
+    if entries is None:
+        try:
+            with os.scandir(parent) as it:
+                entries = frozenset(os.path.normcase(entry.name) for entry in it)
+        except OSError:
+            entries = frozenset()
+        dir_index[parent] = entries
+    return entries
+
+
+def _find_subject_doc(subject: str, dir_index: Dict[Path, frozenset]
+                      ) -> Tuple[Optional[Path], Optional[os.stat_result]]:
+    """Return (path, stat) of the first existing candidate document, or (None, None).
+
+    Only the matching candidate is stat()ed; the others are ruled out against
+    dir_index, and candidates after the match are never built.
+    """
+    for path in _doc_candidates(subject):
+        if os.path.normcase(path.name) not in _dir_entries(path.parent, dir_index):
+            continue
+        try:
+            return path, path.stat()
+        except OSError:
+            continue
+    return None, None
+
+
 @dataclass
 class AppConfig:
     """Application configuration."""
@@ -65,6 +216,7 @@ class AppConfig:
     remove_thinking_tags: bool = True
     subject_colors: Dict[str, str] = None
     auto_apply_colors: bool = True
+    max_workers: int = 4  # Subjects processed in parallel
 
     def __post_init__(self):
         if self.subjects is None:
@@ -73,28 +225,11 @@ class AppConfig:
             self.supported_extensions = ['.mp3', '.wav', '.m4a', '.mp4', '.flac', '.aac', '.ogg', '.webm']
         if self.subject_colors is None:
             self.subject_colors = {}
-        if not hasattr(self, 'word_auto_update'):
-            self.word_auto_update = True
-        if not hasattr(self, 'word_font_name'):
-            self.word_font_name = "Calibri"
-        if not hasattr(self, 'word_font_size'):
-            self.word_font_size = 11
-        if not hasattr(self, 'auto_apply_colors'):
-            self.auto_apply_colors = True
-        
-        # New configuration defaults
-        if not hasattr(self, 'provider_mode'):
-            self.provider_mode = "Only OpenRouter"
-        if not hasattr(self, 'primary_provider'):
-            self.primary_provider = "OpenRouter"
-        if not hasattr(self, 'secondary_provider'):
-            self.secondary_provider = "Gemini"
-        if not hasattr(self, 'gemini_model'):
-            self.gemini_model = "gemini-1.5-pro"
-        if not hasattr(self, 'gemini_temperature'):
-            self.gemini_temperature = 0.3
-        if not hasattr(self, 'gemini_max_tokens'):
-            self.gemini_max_tokens = 4000
+
+
+# Field names of AppConfig, in declaration order for stable config files
+_APPCONFIG_FIELD_NAMES = tuple(f.name for f in fields(AppConfig))
+_APPCONFIG_FIELDS = frozenset(_APPCONFIG_FIELD_NAMES)
 
 
 @dataclass
@@ -112,10 +247,19 @@ class ProcessingTask:
 
     def __post_init__(self):
         if not self.created_at:
-            self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.created_at = datetime.now().isoformat(sep=' ', timespec='seconds')
 
+    @functools.cached_property
+    def name(self) -> str:
+        """File name of filepath, for log messages and the tasks tree."""
+        return os.path.basename(self.filepath)
 
-@dataclass
+
+# Slotted dataclasses (3.10+) drop the per-instance __dict__ for objects created per scanned file
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ReprocessingFileInfo:
     """Information about a file available for reprocessing."""
     filepath: str
@@ -128,23 +272,22 @@ class ReprocessingFileInfo:
     file_size: int = 0
     modified_date: str = ""
     selected: bool = False
+    # Reprocessing tree columns after the checkbox, filled in once by the scanner
+    row_values: Tuple[str, ...] = ()
 
 
-class AudioFileHandler(FileSystemEventHandler):
-    """Handles file system events for new audio files."""
-
-    def __init__(self, app):
-        self.app = app
-
-    def on_created(self, event):
-        if event.is_directory:
-            return
-        self.app.handle_new_file(event.src_path)
-
-    def on_moved(self, event):
-        if event.is_directory:
-            return
-        self.app.handle_new_file(event.dest_path)
+def _reprocess_row_values(file_info: ReprocessingFileInfo) -> Tuple[str, ...]:
+    """Display values for file_info's reprocessing tree row, minus the Select column."""
+    has_transcript, has_notes = file_info.has_transcript, file_info.has_notes
+    return (
+        file_info.filename,
+        file_info.subject,
+        f"{file_info.file_size / 1048576:.1f} MB",
+        file_info.modified_date,
+        "✓" if has_transcript else "✗",
+        "✓" if has_notes else "✗",
+        _REPROCESS_STATUS[has_transcript, has_notes]
+    )
 
 
 class NoteProcessingThread(threading.Thread):
@@ -154,21 +297,23 @@ class NoteProcessingThread(threading.Thread):
         super().__init__(daemon=True)
         self.task_queue = task_queue
         self.app = app
-        self.running = True
 
     def run(self):
-        while self.running:
+        while True:
+            task = self.task_queue.get()
+            if task is None:
+                self.task_queue.task_done()
+                break
             try:
-                task = self.task_queue.get(timeout=1)
                 self.app.process_task(task)
-                self.task_queue.task_done()
-            except queue.Empty:
-                continue
             except Exception as e:
                 logging.error(f"Error in processing thread: {e}")
+            finally:
+                self.task_queue.task_done()
 
     def stop(self):
-        self.running = False
+        """Ask the thread to exit once the tasks already queued are done."""
+        self.task_queue.put(None)
 
 
 class SchoolNoteApp:
@@ -176,35 +321,91 @@ class SchoolNoteApp:
 
     def __init__(self):
         self.config = AppConfig()
+        self._ext_set = frozenset(e.lower() for e in self.config.supported_extensions)
+        self._refresh_subjects()
         self.config_file = Path("app_config.json")
+        self._saved_config_bytes: Optional[bytes] = None  # last payload written by save_config
         self.tasks: Dict[str, ProcessingTask] = {}
-        self.task_queue = queue.Queue()
-        self.processing_thread = None
-        self.observer = None
+        # Values last written to each tasks_tree row (iid = task filepath)
+        self._task_row_values: Dict[str, tuple] = {}
+        # One queue + worker per subject, capped at config.max_workers workers
+        self._queues: Dict[str, queue.Queue] = {}
+        self._workers: Dict[str, NoteProcessingThread] = {}
+        self._workers_lock = threading.Lock()
+        self._word_lock = threading.Lock()
+        self._status_lock = threading.Lock()
+        self._queued_count = 0  # tasks whose status starts with "queued"
+        # Tasks by status (keyed by id(task)), kept in step by _set_task_status
+        self._tasks_by_status: Dict[str, Dict[int, ProcessingTask]] = {}
+        self._gui_refresh_pending = False
+        self._color_refresh_pending = False
+        self._after_ids: Dict[str, str] = {}  # pending _debounce callbacks by key
+        # Activity log lines written before the Monitoring tab exists
+        self.activity_text = None
+        # Lines waiting to be written to activity_text (flushed in batches)
+        self._activity_backlog: List[str] = []
+        self._activity_flush_pending = False
+        self._activity_lock = threading.Lock()
+        self._watch_thread = None
+        self._stop_evt = threading.Event()
+        # New files from the watcher wait here until they stop growing
+        self._new_file_queue = queue.Queue(maxsize=256)
+        self._settler_thread: Optional[threading.Thread] = None
+        # Subjects whose transcripts/ and notes/ dirs have been created this session
+        self._ensured_dirs: Set[str] = set()
+        # Subject -> Word documents folder found by open_word_documents_folder
+        self._word_folder_cache: Dict[str, str] = {}
+        self._subject_doc_cache: Dict[str, Tuple[Optional[Path], Optional[os.stat_result], float]] = {}
 
         self.reprocessing_files: Dict[str, ReprocessingFileInfo] = {}
-        self.selected_files: Set[str] = set()
+        # Number of scanned files with selected=True; the flags live on each ReprocessingFileInfo
+        self._selected_count = 0
+        # Scan results in display order; only the first _reprocess_rendered are in the tree
+        self._reprocess_order: List[str] = []
+        self._reprocess_rendered = 0
+        self._reprocess_page_pending = False
+        # Position of each scanned filepath in _reprocess_order
+        self._reprocess_index: Dict[str, int] = {}
+        # Scanned filepaths grouped by subject, for select_by_subject
+        self._reprocess_by_subject: Dict[str, List[str]] = {}
+        # Background directory scan; results are drained on the Tk thread.
+        # Each scan gets its own queue so a rescan can't drain a previous scan's leftovers.
+        self._scan_queue: Optional[queue.Queue] = None
+        # Set to stop the running scan when a newer one replaces it
+        self._scan_cancel: Optional[threading.Event] = None
+        self._scan_thread: Optional[threading.Thread] = None
 
         self.assemblyai_key_file = Path("assemblyai_api_key.txt")
         self.openrouter_key_file = Path("openrouter_api_key.txt")
         self.gemini_key_file = Path("gemini_api_key.txt")
         self.pre_prompt_file = Path("pre_prompt.txt")
+        self._pre_prompt_cached: Optional[str] = None
+        self._pre_prompt_stamp = None  # (mtime_ns, size) the cached text was read at
         self.word_manager = None
+        self._last_word_fmt: Optional[WordFormattingConfig] = None
         self.init_word_manager()
 
+        # Threads only enqueue log records; a listener thread writes them to
+        # the log file and console, so workers never block on log I/O
+        log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        log_handlers = [logging.FileHandler('note_app.log'), logging.StreamHandler()]
+        for handler in log_handlers:
+            handler.setFormatter(log_formatter)
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, *log_handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
+
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('note_app.log'),
-                logging.StreamHandler()
-            ]
+            handlers=[logging.handlers.QueueHandler(log_queue)],
+            force=True
         )
 
         self.load_config()
         self.ensure_pre_prompt_file()
         self.setup_gui()
-        self.start_processing_thread()
 
         if self.config.watch_directory and os.path.exists(self.config.watch_directory):
             self.start_file_monitoring()
@@ -229,6 +430,10 @@ Transcript to process:"""
             try:
                 with open(self.pre_prompt_file, 'w', encoding='utf-8') as f:
                     f.write(default_prompt)
+                # Seed the cache so the first read_pre_prompt() doesn't go back to disk
+                st = self.pre_prompt_file.stat()
+                self._pre_prompt_cached = default_prompt
+                self._pre_prompt_stamp = (st.st_mtime_ns, st.st_size)
             except Exception as e:
                 logging.error(f"Error creating default pre-prompt file: {e}")
 
@@ -243,7 +448,11 @@ Transcript to process:"""
                 heading3_size=self.config.word_heading3_size,
                 line_spacing=self.config.word_line_spacing
             )
+            # Keep the existing manager (and its loaded tracking data) if nothing changed
+            if self.word_manager is not None and formatting_config == self._last_word_fmt:
+                return
             self.word_manager = WordDocumentManager(formatting_config)
+            self._last_word_fmt = formatting_config
             logging.info("Word document manager initialized")
         except Exception as e:
             logging.error(f"Error initializing Word document manager: {e}")
@@ -255,8 +464,7 @@ Transcript to process:"""
             return
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            raw_data = _config_loads(self.config_file.read_bytes())
 
             if not isinstance(raw_data, dict):
                 logging.error("Error loading configuration: app_config.json is not a JSON object")
@@ -292,14 +500,15 @@ Transcript to process:"""
             if "line_spacing" in data and "word_line_spacing" not in data:
                 data["word_line_spacing"] = data.get("line_spacing")
 
-            valid_keys = {f.name for f in fields(AppConfig)}
-            filtered = {k: v for k, v in data.items() if k in valid_keys}
+            filtered = {k: v for k, v in data.items() if k in _APPCONFIG_FIELDS}
 
-            ignored = sorted(set(data.keys()) - valid_keys)
+            ignored = sorted(data.keys() - _APPCONFIG_FIELDS)
             if ignored:
                 logging.info(f"Ignoring unknown config keys: {', '.join(ignored)}")
 
             self.config = AppConfig(**filtered)
+            self._ext_set = frozenset(e.lower() for e in self.config.supported_extensions)
+            self._refresh_subjects()
             logging.info("Configuration loaded successfully")
 
             # Ensure dependent services reflect loaded settings
@@ -310,9 +519,15 @@ Transcript to process:"""
 
     def save_config(self):
         """Save configuration to file."""
+        self._subject_doc_cache.clear()
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.config), f, indent=2)
+            # Shallow view of the fields: lists/dicts are serialised in place, not copied
+            data = {name: getattr(self.config, name) for name in _APPCONFIG_FIELD_NAMES}
+            payload = _config_dumps(data)
+            if payload == self._saved_config_bytes and self.config_file.exists():
+                return
+            self.config_file.write_bytes(payload)
+            self._saved_config_bytes = payload
             logging.info("Configuration saved successfully")
         except Exception as e:
             logging.error(f"Error saving configuration: {e}")
@@ -339,10 +554,25 @@ Transcript to process:"""
             return False
 
     def read_pre_prompt(self) -> str:
-        """Read pre-prompt from file."""
+        """Read pre-prompt from file, reusing the last read while the file is unchanged."""
         try:
-            with open(self.pre_prompt_file, 'r', encoding='utf-8') as f:
-                return f.read()
+            st = self.pre_prompt_file.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._pre_prompt_cached is not None and stamp == self._pre_prompt_stamp:
+                return self._pre_prompt_cached
+
+            # Decode straight out of a read-only mapping to avoid an extra bytes copy
+            with open(self.pre_prompt_file, 'rb') as f:
+                if st.st_size == 0:
+                    prompt = ""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        prompt = str(mm, 'utf-8')
+            # Match text-mode newline handling for prompts saved on Windows
+            if '\r' in prompt:
+                prompt = prompt.replace('\r\n', '\n')
+            self._pre_prompt_cached, self._pre_prompt_stamp = prompt, stamp
+            return prompt
         except Exception as e:
             logging.error(f"Error reading pre-prompt: {e}")
             return ""
@@ -352,6 +582,9 @@ Transcript to process:"""
         try:
             with open(self.pre_prompt_file, 'w', encoding='utf-8') as f:
                 f.write(prompt)
+            st = self.pre_prompt_file.stat()
+            self._pre_prompt_cached = prompt
+            self._pre_prompt_stamp = (st.st_mtime_ns, st.st_size)
             return True
         except Exception as e:
             logging.error(f"Error writing pre-prompt: {e}")
@@ -360,10 +593,38 @@ Transcript to process:"""
 
     def remove_thinking_tags(self, text: str) -> str:
         """Remove content between <think> and </think> tags."""
-        import re
-        pattern = r'<think\s*>.*?</think\s*>'
-        cleaned_text = re.sub(pattern, '', text, flags=re.DOTALL | re.IGNORECASE)
-        return cleaned_text
+        first = _THINK_RE.search(text)
+        if first is None:
+            return text
+
+        kept = [text[:first.start()]]
+        pos = first.end()
+        for match in _THINK_RE.finditer(text, pos):
+            kept.append(text[pos:match.start()])
+            pos = match.end()
+        kept.append(text[pos:])
+        return ''.join(kept)
+
+    def _resolve_subject_doc(self, subject: str,
+                             dir_index: Optional[Dict[Path, frozenset]] = None
+                             ) -> Tuple[Optional[Path], Optional[os.stat_result]]:
+        """Return (path, stat) of the subject's combined notes document, or (None, None).
+
+        Found documents are cached for SUBJECT_DOC_CACHE_TTL seconds so repeated
+        GUI refreshes don't stat every candidate location again; misses aren't,
+        so a document created by a worker shows up on the next lookup. Callers
+        resolving many subjects can pass a shared dir_index so each parent
+        directory is listed only once.
+        """
+        now = time.monotonic()
+        cached = self._subject_doc_cache.get(subject)
+        if cached is not None and now - cached[2] < SUBJECT_DOC_CACHE_TTL:
+            return cached[0], cached[1]
+
+        word_doc, doc_stat = _find_subject_doc(subject, {} if dir_index is None else dir_index)
+        if word_doc is not None:
+            self._subject_doc_cache[subject] = (word_doc, doc_stat, now)
+        return word_doc, doc_stat
 
     def apply_color_to_word_document(self, subject: str):
         """Apply color palette to subject's Word document."""
@@ -376,33 +637,21 @@ Transcript to process:"""
             logging.info(f"Default color selected for {subject}, skipping color application")
             return
     
-        # Search for the Word document in multiple possible locations
-        possible_paths = [
-            # Location 1: .\Appunti Completi\{subject}\{subject}_combined_notes.docx
-            Path("Appunti Completi") / subject / f"{subject}_combined_notes.docx",
-            # Location 2: .\{subject}\Appunti Completi\{subject}_combined_notes.docx
-            Path(subject) / "Appunti Completi" / f"{subject}_combined_notes.docx",
-            # Location 3: Current directory
-            Path(f"{subject}_combined_notes.docx"),
-            # Location 4: Subject directory
-            Path(subject) / f"{subject}_combined_notes.docx"
-        ]
-    
-        word_doc_path = None
-        for path in possible_paths:
-            if path.exists():
-                word_doc_path = path
-                logging.info(f"Found Word document at: {word_doc_path}")
-                break
+        word_doc_path, _ = self._resolve_subject_doc(subject)
     
         if not word_doc_path:
             logging.warning(f"Word document not found for {subject}. Searched in:")
-            for path in possible_paths:
+            for path in _doc_candidates(subject):
                 logging.warning(f"  - {path}")
             return
+
+        logging.info(f"Found Word document at: {word_doc_path}")
     
         try:
-            change_theme_colors(str(word_doc_path), palette_name)
+            if not change_theme_colors(str(word_doc_path), palette_name):
+                logging.info(f"{subject} document already uses '{palette_name}', unchanged")
+                return
+            self._subject_doc_cache.pop(subject, None)
             self.log_activity(f"Applied '{COLOR_PALETTES[palette_name]['name']}' color to {subject} document")
             logging.info(f"Color '{palette_name}' applied to {subject} document at {word_doc_path}")
         except Exception as e:
@@ -418,14 +667,27 @@ Transcript to process:"""
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        self.setup_config_tab(self.notebook)
-        self.setup_api_keys_tab(self.notebook)
-        self.setup_pre_prompt_tab(self.notebook)
-        self.setup_monitoring_tab(self.notebook)
-        self.setup_tasks_tab(self.notebook)
-        self.setup_reprocessing_tab(self.notebook)
-        self.setup_word_tab(self.notebook)
-        self.setup_color_management_tab(self.notebook)
+        # Tabs are empty frames until first shown; see _build_tab
+        self._tab_frames: Dict[str, ttk.Frame] = {}
+        self._tab_builders = {}
+        for title, builder in (
+            ("Configuration", self.setup_config_tab),
+            ("API Keys", self.setup_api_keys_tab),
+            ("Pre-Prompt", self.setup_pre_prompt_tab),
+            ("Monitoring", self.setup_monitoring_tab),
+            ("Processing Tasks", self.setup_tasks_tab),
+            ("Reprocessing", self.setup_reprocessing_tab),
+            ("Word Documents", self.setup_word_tab),
+            ("Color Management", self.setup_color_management_tab),
+        ):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_frames[title] = frame
+            self._tab_builders[str(frame)] = builder
+
+        # Only the tab visible at startup is built straight away
+        self._build_tab(self._tab_frames["Configuration"])
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
@@ -434,11 +696,30 @@ Transcript to process:"""
 
         self.update_gui()
 
+    def _build_tab(self, frame):
+        """Populate a notebook tab the first time it is needed."""
+        builder = self._tab_builders.pop(str(frame), None)
+        if builder is not None:
+            builder(frame)
+            self.update_gui()
+
+    def on_tab_changed(self, event):
+        """Build the newly selected tab if it hasn't been built yet."""
+        self._build_tab(self.notebook.select())
+
     def update_gui(self):
+        """Schedule a GUI refresh; calls made before it runs share one redraw."""
+        if self._gui_refresh_pending:
+            return
+        self._gui_refresh_pending = True
+        self.root.after_idle(self._do_update_gui)
+
+    def _do_update_gui(self):
         """Refresh dynamic GUI elements based on current app state."""
+        self._gui_refresh_pending = False
         try:
             if hasattr(self, "monitor_status_var"):
-                if self.observer and self.observer.is_alive():
+                if self.is_monitoring():
                     self.monitor_status_var.set(f"Monitoring: {self.config.watch_directory}")
                 else:
                     if self.config.watch_directory:
@@ -450,7 +731,7 @@ Transcript to process:"""
                         self.monitor_status_var.set("Not monitoring (no watch directory configured)")
 
             if hasattr(self, "status_var"):
-                queued = sum(1 for t in self.tasks.values() if str(t.status).startswith("queued"))
+                queued = self._queued_count
                 self.status_var.set(f"Ready • {queued} queued" if queued else "Ready")
 
             if hasattr(self, "provider_mode_var"):
@@ -465,10 +746,8 @@ Transcript to process:"""
         except Exception as e:
             logging.error(f"Error updating GUI: {e}")
 
-    def setup_color_management_tab(self, notebook):
+    def setup_color_management_tab(self, color_frame):
         """Setup color management tab."""
-        color_frame = ttk.Frame(notebook)
-        notebook.add(color_frame, text="Color Management")
 
         ttk.Label(color_frame, text="Assign color palettes to each subject:",
                  font=("", 11, "bold")).pack(anchor=tk.W, padx=10, pady=(10, 5))
@@ -534,14 +813,24 @@ Transcript to process:"""
         self.refresh_color_assignments()
 
     def refresh_color_assignments(self):
+        """Schedule a refresh of the color assignments display."""
+        if self._color_refresh_pending:
+            return
+        self._color_refresh_pending = True
+        self.root.after_idle(self._do_refresh_color_assignments)
+
+    def _do_refresh_color_assignments(self):
         """Refresh the color assignments display."""
-        for item in self.color_tree.get_children():
-            self.color_tree.delete(item)
+        self._color_refresh_pending = False
+        if not hasattr(self, "color_tree"):
+            return
+        self.color_tree.delete(*self.color_tree.get_children())
     
         if not self.config.subjects:
             self.color_tree.insert("", tk.END, values=("No subjects configured", "", ""))
             return
     
+        dir_index: Dict[Path, frozenset] = {}
         for subject in self.config.subjects:
             assigned_color = self.config.subject_colors.get(subject, "default")
     
@@ -552,22 +841,10 @@ Transcript to process:"""
             else:
                 color_name = f"Unknown ({assigned_color})"
     
-            # Search for Word document in multiple locations
-            possible_paths = [
-                Path("Appunti Completi") / subject / f"{subject}_combined_notes.docx",
-                Path(subject) / "Appunti Completi" / f"{subject}_combined_notes.docx",
-                Path(f"{subject}_combined_notes.docx"),
-                Path(subject) / f"{subject}_combined_notes.docx"
-            ]
-    
-            word_doc = None
-            for path in possible_paths:
-                if path.exists():
-                    word_doc = path
-                    break
+            word_doc, doc_stat = self._resolve_subject_doc(subject, dir_index)
     
             if word_doc:
-                status = f"✓ Document exists at: {word_doc.parent.name}/{word_doc.name} ({word_doc.stat().st_size / 1024:.1f} KB)"
+                status = f"✓ Document exists at: {word_doc.parent.name}/{word_doc.name} ({doc_stat.st_size / 1024:.1f} KB)"
             else:
                 status = "Document not yet created"
     
@@ -674,9 +951,10 @@ Transcript to process:"""
         error_count = 0
     
         self.color_status_var.set("Applying colors to documents...")
-        self.root.update()
+        self.root.update_idletasks()
     
         results_details = []
+        dir_index: Dict[Path, frozenset] = {}
     
         for subject in self.config.subjects:
             if subject not in self.config.subject_colors or self.config.subject_colors[subject] == "default":
@@ -684,19 +962,7 @@ Transcript to process:"""
                 results_details.append(f"{subject}: Skipped (no color assigned)")
                 continue
     
-            # Search for the Word document
-            possible_paths = [
-                Path("Appunti Completi") / subject / f"{subject}_combined_notes.docx",
-                Path(subject) / "Appunti Completi" / f"{subject}_combined_notes.docx",
-                Path(f"{subject}_combined_notes.docx"),
-                Path(subject) / f"{subject}_combined_notes.docx"
-            ]
-    
-            word_doc = None
-            for path in possible_paths:
-                if path.exists():
-                    word_doc = path
-                    break
+            word_doc, _ = self._resolve_subject_doc(subject, dir_index)
     
             if not word_doc:
                 skipped_count += 1
@@ -738,10 +1004,8 @@ Transcript to process:"""
         self.refresh_color_assignments()
         self.color_status_var.set("All color assignments cleared")
 
-    def setup_config_tab(self, notebook):
+    def setup_config_tab(self, config_frame):
         """Setup configuration tab."""
-        config_frame = ttk.Frame(notebook)
-        notebook.add(config_frame, text="Configuration")
         
         # --- File Settings ---
         file_frame = ttk.LabelFrame(config_frame, text="File Settings", padding=10)
@@ -807,10 +1071,9 @@ Transcript to process:"""
         ttk.Label(self.openrouter_frame, text="Temperature:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         self.temperature_var = tk.DoubleVar(value=self.config.openrouter_temperature)
         ttk.Scale(self.openrouter_frame, from_=0.0, to=2.0, variable=self.temperature_var,
-                 orient=tk.HORIZONTAL, length=300).grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
+                 command=self.update_temperature_label, orient=tk.HORIZONTAL, length=300).grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
         self.temp_label = ttk.Label(self.openrouter_frame, text=f"{self.config.openrouter_temperature:.1f}")
         self.temp_label.grid(row=1, column=2, padx=5, pady=5)
-        self.temperature_var.trace('w', self.update_temperature_label)
         
         ttk.Label(self.openrouter_frame, text="Max Tokens:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         self.max_tokens_var = tk.IntVar(value=self.config.openrouter_max_tokens)
@@ -834,10 +1097,9 @@ Transcript to process:"""
         ttk.Label(self.gemini_frame, text="Temperature:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         self.gemini_temperature_var = tk.DoubleVar(value=self.config.gemini_temperature)
         ttk.Scale(self.gemini_frame, from_=0.0, to=2.0, variable=self.gemini_temperature_var,
-                 orient=tk.HORIZONTAL, length=300).grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
+                 command=self.update_gemini_temperature_label, orient=tk.HORIZONTAL, length=300).grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
         self.gemini_temp_label = ttk.Label(self.gemini_frame, text=f"{self.config.gemini_temperature:.1f}")
         self.gemini_temp_label.grid(row=1, column=2, padx=5, pady=5)
-        self.gemini_temperature_var.trace('w', self.update_gemini_temperature_label)
         
         ttk.Label(self.gemini_frame, text="Max Tokens:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         self.gemini_max_tokens_var = tk.IntVar(value=self.config.gemini_max_tokens)
@@ -871,103 +1133,95 @@ Transcript to process:"""
         
         ttk.Button(config_frame, text="Save Configuration", command=self.save_configuration).pack(pady=20)
         
-        # Initialize UI state based on current config
+        # Initialize UI state based on current config; all three frames start shown
+        self._provider_frames_shown = (True, True, True)
         self.on_provider_mode_change(None)
 
     def on_provider_mode_change(self, event):
         """Handle provider mode change."""
         mode = self.provider_mode_var.get()
         
-        if mode == "Only OpenRouter":
-            self.fallback_frame.grid_remove()
-            self.openrouter_frame.pack(fill=tk.X, pady=5)
-            self.gemini_frame.pack_forget()
-        elif mode == "Only Gemini":
-            self.fallback_frame.grid_remove()
-            self.openrouter_frame.pack_forget()
-            self.gemini_frame.pack(fill=tk.X, pady=5)
-        elif mode == "Fallback Mode":
-            self.fallback_frame.grid()
-            self.openrouter_frame.pack(fill=tk.X, pady=5)
-            self.gemini_frame.pack(fill=tk.X, pady=5)
-
-    def update_gemini_temperature_label(self, *args):
-        """Update gemini temperature label."""
-        self.gemini_temp_label.config(text=f"{self.gemini_temperature_var.get():.1f}")
-
-    def setup_api_keys_tab(self, notebook):
+        # (fallback options, OpenRouter frame, Gemini frame) visibility per mode
+        wanted = {
+            "Only OpenRouter": (False, True, False),
+            "Only Gemini": (False, False, True),
+            "Fallback Mode": (True, True, True),
+        }.get(mode, self._provider_frames_shown)
+        if wanted == self._provider_frames_shown:
+            return
+
+        want_fallback, want_openrouter, want_gemini = wanted
+        shown_fallback, shown_openrouter, shown_gemini = self._provider_frames_shown
+
+        # Only touch geometry for frames whose visibility actually changes
+        if want_fallback != shown_fallback:
+            if want_fallback:
+                self.fallback_frame.grid()
+            else:
+                self.fallback_frame.grid_remove()
+        if want_gemini != shown_gemini:
+            if want_gemini:
+                self.gemini_frame.pack(fill=tk.X, pady=5)
+            else:
+                self.gemini_frame.pack_forget()
+        if want_openrouter != shown_openrouter:
+            if not want_openrouter:
+                self.openrouter_frame.pack_forget()
+            elif want_gemini:
+                # Keep OpenRouter above Gemini
+                self.openrouter_frame.pack(fill=tk.X, pady=5, before=self.gemini_frame)
+            else:
+                self.openrouter_frame.pack(fill=tk.X, pady=5)
+
+        self._provider_frames_shown = wanted
+
+    def update_gemini_temperature_label(self, value: str):
+        """Update gemini temperature label from the Scale's command callback."""
+        self._debounce("gemini_temperature_label", lambda: self.gemini_temp_label.config(
+            text=f"{float(value):.1f}"))
+
+    def setup_api_keys_tab(self, api_frame):
         """Setup API keys management tab."""
-        api_frame = ttk.Frame(notebook)
-        notebook.add(api_frame, text="API Keys")
-
-        # --- AssemblyAI ---
-        assemblyai_frame = ttk.LabelFrame(api_frame, text="AssemblyAI API Key", padding=10)
-        assemblyai_frame.pack(fill=tk.X, padx=10, pady=10)
-
-        self.assemblyai_key_var = tk.StringVar()
-        assemblyai_entry = ttk.Entry(assemblyai_frame, textvariable=self.assemblyai_key_var,
-                                   width=80, show="*", font=("Consolas", 9))
-        assemblyai_entry.pack(fill=tk.X, pady=(0, 10))
-
-        assemblyai_buttons = ttk.Frame(assemblyai_frame)
-        assemblyai_buttons.pack(fill=tk.X)
-
-        ttk.Button(assemblyai_buttons, text="Load from File",
-                  command=lambda: self.load_api_key(self.assemblyai_key_file, self.assemblyai_key_var)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(assemblyai_buttons, text="Save to File",
-                  command=lambda: self.save_api_key(self.assemblyai_key_file, self.assemblyai_key_var.get())).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(assemblyai_buttons, text="Test Connection",
-                  command=self.test_assemblyai_connection).pack(side=tk.LEFT, padx=(0, 5))
-
-        # --- OpenRouter ---
-        openrouter_frame = ttk.LabelFrame(api_frame, text="OpenRouter API Key", padding=10)
-        openrouter_frame.pack(fill=tk.X, padx=10, pady=10)
-
-        self.openrouter_key_var = tk.StringVar()
-        openrouter_entry = ttk.Entry(openrouter_frame, textvariable=self.openrouter_key_var,
-                                   width=80, show="*", font=("Consolas", 9))
-        openrouter_entry.pack(fill=tk.X, pady=(0, 10))
-
-        openrouter_buttons = ttk.Frame(openrouter_frame)
-        openrouter_buttons.pack(fill=tk.X)
-
-        ttk.Button(openrouter_buttons, text="Load from File",
-                  command=lambda: self.load_api_key(self.openrouter_key_file, self.openrouter_key_var)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(openrouter_buttons, text="Save to File",
-                  command=lambda: self.save_api_key(self.openrouter_key_file, self.openrouter_key_var.get())).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(openrouter_buttons, text="Test Connection",
-                  command=self.test_openrouter_connection).pack(side=tk.LEFT, padx=(0, 5))
-
-        # --- Gemini ---
-        gemini_frame = ttk.LabelFrame(api_frame, text="Gemini API Key", padding=10)
-        gemini_frame.pack(fill=tk.X, padx=10, pady=10)
-
-        self.gemini_key_var = tk.StringVar()
-        gemini_entry = ttk.Entry(gemini_frame, textvariable=self.gemini_key_var,
-                                   width=80, show="*", font=("Consolas", 9))
-        gemini_entry.pack(fill=tk.X, pady=(0, 10))
-
-        gemini_buttons = ttk.Frame(gemini_frame)
-        gemini_buttons.pack(fill=tk.X)
-
-        ttk.Button(gemini_buttons, text="Load from File",
-                  command=lambda: self.load_api_key(self.gemini_key_file, self.gemini_key_var)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(gemini_buttons, text="Save to File",
-                  command=lambda: self.save_api_key(self.gemini_key_file, self.gemini_key_var.get())).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(gemini_buttons, text="Test Connection",
-                  command=self.test_gemini_connection).pack(side=tk.LEFT, padx=(0, 5))
-
-        self.load_api_key(self.assemblyai_key_file, self.assemblyai_key_var)
-        self.load_api_key(self.openrouter_key_file, self.openrouter_key_var)
-        self.load_api_key(self.gemini_key_file, self.gemini_key_var)
+
+        self.assemblyai_key_var = self._make_key_frame(
+            api_frame, "AssemblyAI API Key", self.assemblyai_key_file, self.test_assemblyai_connection)
+        self.openrouter_key_var = self._make_key_frame(
+            api_frame, "OpenRouter API Key", self.openrouter_key_file, self.test_openrouter_connection)
+        self.gemini_key_var = self._make_key_frame(
+            api_frame, "Gemini API Key", self.gemini_key_file, self.test_gemini_connection)
+
+        self.load_api_keys_async((
+            (self.assemblyai_key_file, self.assemblyai_key_var),
+            (self.openrouter_key_file, self.openrouter_key_var),
+            (self.gemini_key_file, self.gemini_key_var),
+        ))
 
         self.api_status_var = tk.StringVar(value="API keys status: Not tested")
         ttk.Label(api_frame, textvariable=self.api_status_var).pack(pady=10)
 
-    def setup_pre_prompt_tab(self, notebook):
+    def _make_key_frame(self, parent, title: str, key_file: Path, test_cmd) -> tk.StringVar:
+        """Build an API key entry with Load/Save/Test buttons and return its variable."""
+        frame = ttk.LabelFrame(parent, text=title, padding=10)
+        frame.pack(fill=tk.X, padx=10, pady=10)
+
+        key_var = tk.StringVar()
+        ttk.Entry(frame, textvariable=key_var, width=80, show="*",
+                  font=("Consolas", 9)).pack(fill=tk.X, pady=(0, 10))
+
+        buttons = ttk.Frame(frame)
+        buttons.pack(fill=tk.X)
+
+        ttk.Button(buttons, text="Load from File",
+                  command=functools.partial(self.load_api_key, key_file, key_var)).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(buttons, text="Save to File",
+                  command=functools.partial(self._save_key_cb, key_file, key_var)).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(buttons, text="Test Connection",
+                  command=test_cmd).pack(side=tk.LEFT, padx=(0, 5))
+
+        return key_var
+
+    def setup_pre_prompt_tab(self, prompt_frame):
         """Setup pre-prompt management tab."""
-        prompt_frame = ttk.Frame(notebook)
-        notebook.add(prompt_frame, text="Pre-Prompt")
 
         ttk.Label(prompt_frame, text="Customize the pre-prompt sent before each transcript:",
                  font=("", 10, "bold")).pack(anchor=tk.W, padx=10, pady=(10, 5))
@@ -993,12 +1247,10 @@ Transcript to process:"""
         ttk.Label(buttons_frame, textvariable=self.prompt_char_var).pack(side=tk.RIGHT)
 
         self.prompt_text.bind('<KeyRelease>', self.update_prompt_char_count)
-        self.update_prompt_char_count()
+        self._do_update_prompt_char_count()
 
-    def setup_monitoring_tab(self, notebook):
+    def setup_monitoring_tab(self, monitor_frame):
         """Setup monitoring tab."""
-        monitor_frame = ttk.Frame(notebook)
-        notebook.add(monitor_frame, text="Monitoring")
 
         ttk.Label(monitor_frame, text="File Monitoring Status:").pack(anchor=tk.W, padx=10, pady=(10, 5))
         self.monitor_status_var = tk.StringVar()
@@ -1015,17 +1267,21 @@ Transcript to process:"""
         log_frame = ttk.Frame(monitor_frame)
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        self.activity_text = tk.Text(log_frame, height=15, state=tk.DISABLED)
-        scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.activity_text.yview)
-        self.activity_text.configure(yscrollcommand=scrollbar.set)
+        activity_text = tk.Text(log_frame, height=15, state=tk.DISABLED)
+        scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=activity_text.yview)
+        activity_text.configure(yscrollcommand=scrollbar.set)
 
-        self.activity_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        activity_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-    def setup_tasks_tab(self, notebook):
+        with self._activity_lock:
+            self.activity_text = activity_text
+            if self._activity_backlog:
+                self._write_activity(self._activity_backlog)
+                self._activity_backlog.clear()
+
+    def setup_tasks_tab(self, tasks_frame):
         """Setup tasks tab."""
-        tasks_frame = ttk.Frame(notebook)
-        notebook.add(tasks_frame, text="Processing Tasks")
 
         columns = ("File", "Subject", "Status", "Created", "Tokens", "Progress")
         self.tasks_tree = ttk.Treeview(tasks_frame, columns=columns, show="headings", height=15)
@@ -1058,10 +1314,8 @@ Transcript to process:"""
         ttk.Button(task_buttons_frame, text="Retry Failed", command=self.retry_failed_tasks).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(task_buttons_frame, text="Open Notes Folder", command=self.open_notes_folder).pack(side=tk.LEFT, padx=(0, 5))
 
-    def setup_reprocessing_tab(self, notebook):
+    def setup_reprocessing_tab(self, reprocess_frame):
         """Setup reprocessing tab."""
-        reprocess_frame = ttk.Frame(notebook)
-        notebook.add(reprocess_frame, text="Reprocessing")
 
         controls_frame = ttk.Frame(reprocess_frame)
         controls_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -1109,11 +1363,11 @@ Transcript to process:"""
         self.reprocess_tree.bind("<Button-1>", self.on_reprocess_tree_click)
         self.reprocess_tree.bind("<Double-Button-1>", self.on_reprocess_tree_double_click)
 
-        files_scrollbar = ttk.Scrollbar(files_frame, orient=tk.VERTICAL, command=self.reprocess_tree.yview)
-        self.reprocess_tree.configure(yscrollcommand=files_scrollbar.set)
+        self.reprocess_scrollbar = ttk.Scrollbar(files_frame, orient=tk.VERTICAL, command=self.reprocess_tree.yview)
+        self.reprocess_tree.configure(yscrollcommand=self.on_reprocess_tree_scroll)
 
         self.reprocess_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        files_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.reprocess_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         action_frame = ttk.Frame(reprocess_frame)
         action_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -1145,13 +1399,11 @@ Transcript to process:"""
         self.reprocess_status_var = tk.StringVar(value="Ready to scan files")
         ttk.Label(status_frame, textvariable=self.reprocess_status_var, font=("", 10, "bold")).pack(anchor=tk.W)
 
-    def setup_word_tab(self, notebook):
+    def setup_word_tab(self, word_frame):
         """Setup Word document formatting tab."""
-        word_frame = ttk.Frame(notebook)
-        notebook.add(word_frame, text="Word Documents")
 
         ttk.Label(word_frame, text="Document Settings:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.word_auto_update_var = tk.BooleanVar(value=getattr(self.config, 'word_auto_update', True))
+        self.word_auto_update_var = tk.BooleanVar(value=self.config.word_auto_update)
         ttk.Checkbutton(word_frame, text="Auto-update Word documents when new notes are generated",
                        variable=self.word_auto_update_var).grid(row=0, column=1, columnspan=2, sticky=tk.W, padx=5, pady=5)
 
@@ -1159,30 +1411,33 @@ Transcript to process:"""
         font_frame.grid(row=1, column=0, columnspan=3, sticky=tk.EW, padx=10, pady=10)
 
         ttk.Label(font_frame, text="Font Name:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.word_font_name_var = tk.StringVar(value=getattr(self.config, 'word_font_name', 'Calibri'))
+        self.word_font_name_var = tk.StringVar(value=self.config.word_font_name)
         font_combo = ttk.Combobox(font_frame, textvariable=self.word_font_name_var, width=25)
         font_combo.grid(row=0, column=1, padx=5, pady=5)
         font_combo['values'] = ["Calibri", "Times New Roman", "Arial", "Helvetica", "Georgia", "Verdana"]
 
         ttk.Label(font_frame, text="Font Size:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.word_font_size_var = tk.IntVar(value=getattr(self.config, 'word_font_size', 11))
+        self.word_font_size_var = tk.IntVar(value=self.config.word_font_size)
         ttk.Spinbox(font_frame, from_=8, to=24, textvariable=self.word_font_size_var, width=23).grid(row=1, column=1, padx=5, pady=5)
 
         ttk.Label(font_frame, text="Line Spacing:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.word_line_spacing_var = tk.DoubleVar(value=getattr(self.config, 'word_line_spacing', 1.15))
+        self.word_line_spacing_var = tk.DoubleVar(value=self.config.word_line_spacing)
         ttk.Scale(font_frame, from_=1.0, to=3.0, variable=self.word_line_spacing_var,
-                 orient=tk.HORIZONTAL, length=200).grid(row=2, column=1, padx=5, pady=5)
+                 command=self.update_line_spacing_label, orient=tk.HORIZONTAL, length=200).grid(row=2, column=1, padx=5, pady=5)
         self.word_line_spacing_label = ttk.Label(font_frame, text=f"{self.word_line_spacing_var.get():.2f}")
         self.word_line_spacing_label.grid(row=2, column=2, padx=5, pady=5)
-        self.word_line_spacing_var.trace('w', self.update_line_spacing_label)
 
         headings_frame = ttk.LabelFrame(word_frame, text="Heading Sizes", padding=10)
         headings_frame.grid(row=2, column=0, columnspan=3, sticky=tk.EW, padx=10, pady=10)
 
         self.word_heading_vars = {}
-        for i in range(1, 4):
-            ttk.Label(headings_frame, text=f"Heading {i}:").grid(row=i-1, column=0, sticky=tk.W, padx=5, pady=5)
-            default_size = getattr(self.config, f'word_heading{i}_size', 18-i*2)
+        heading_defaults = (
+            (1, "Heading 1:", self.config.word_heading1_size),
+            (2, "Heading 2:", self.config.word_heading2_size),
+            (3, "Heading 3:", self.config.word_heading3_size),
+        )
+        for i, label, default_size in heading_defaults:
+            ttk.Label(headings_frame, text=label).grid(row=i-1, column=0, sticky=tk.W, padx=5, pady=5)
             self.word_heading_vars[i] = tk.IntVar(value=default_size)
             ttk.Spinbox(headings_frame, from_=10, to=28, textvariable=self.word_heading_vars[i],
                        width=23).grid(row=i-1, column=1, padx=5, pady=5)
@@ -1215,84 +1470,172 @@ Transcript to process:"""
             messagebox.showerror("Error", "Please configure subjects first in the Configuration tab!")
             return
 
+        # The newest request wins: stop the running scan; its drain loop retires itself
+        if self._scan_cancel is not None:
+            self._scan_cancel.set()
+
         self.reprocess_status_var.set("Scanning directory...")
-        self.root.update()
 
-        try:
-            self.reprocessing_files.clear()
-            self.selected_files.clear()
-            for item in self.reprocess_tree.get_children():
-                self.reprocess_tree.delete(item)
+        self.reprocessing_files.clear()
+        self._selected_count = 0
+        self._reprocess_order = []
+        self._reprocess_rendered = 0
+        self._reprocess_index = {}
+        self._reprocess_by_subject = {}
+        self.reprocess_tree.delete(*self.reprocess_tree.get_children())
+
+        scan_queue = self._scan_queue = queue.Queue()
+        cancel = self._scan_cancel = threading.Event()
+        self._scan_thread = threading.Thread(
+            target=self._scan_worker,
+            args=(scan_dir, self._subjects, self._ext_set, scan_queue, cancel),
+            daemon=True
+        )
+        self._scan_thread.start()
+        self.root.after(50, self._drain_scan_queue, scan_queue)
 
-            found_files = 0
-            scan_path = Path(scan_dir)
+    def _scan_worker(self, scan_dir, subjects, ext_set, out, cancel):
+        """Scan scan_dir off the Tk thread, queueing a ReprocessingFileInfo per match onto out.
 
-            for file_path in scan_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.config.supported_extensions:
-                    filename = file_path.name
-                    matching_subject = None
+        Ends with a None sentinel, or the raised exception if the scan failed.
+        Returns early, without a sentinel, once cancel is set by a newer scan.
+        """
+        try:
+            # Normalised so entry.path matches what str(Path) used to produce
+            scan_root = os.path.normpath(scan_dir)
+            # Output directories are listed once each, not stat()ed per file
+            dir_index: Dict[Path, frozenset] = {}
+            # (transcripts dir, notes dir, and their string forms for building output paths)
+            subject_dirs = {}
+            for s in subjects:
+                transcripts_dir, notes_dir = Path(s) / "transcripts", Path(s) / "notes"
+                subject_dirs[s] = (transcripts_dir, notes_dir, str(transcripts_dir), str(notes_dir))
+
+            # Loop-invariant lookups bound once for the per-file body
+            splitext, normcase = os.path.splitext, os.path.normcase
+            strftime, localtime = time.strftime, time.localtime
+            sep = os.sep
+
+            with os.scandir(scan_root) as entries:
+                for entry in entries:
+                    if cancel.is_set():
+                        return
+                    stem, ext = splitext(entry.name)
+                    if ext.lower() not in ext_set:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
 
-                    for subject in self.config.subjects:
-                        if subject.lower() in filename.lower():
-                            matching_subject = subject
-                            break
+                    filename = entry.name
+                    matching_subject = _match_subject(filename, subjects)
 
                     if matching_subject:
                         # Check for existing outputs
-                        subject_dir = Path(matching_subject)
-                        transcripts_dir = subject_dir / "transcripts"
-                        notes_dir = subject_dir / "notes"
+                        transcripts_dir, notes_dir, transcripts_str, notes_str = subject_dirs[matching_subject]
 
-                        transcript_path = transcripts_dir / f"{file_path.stem}.txt"
-                        notes_path = notes_dir / f"{file_path.stem}_notes.md"
+                        transcript_name = f"{stem}.txt"
+                        notes_name = f"{stem}_notes.md"
+                        has_transcript = normcase(transcript_name) in _dir_entries(transcripts_dir, dir_index)
+                        has_notes = normcase(notes_name) in _dir_entries(notes_dir, dir_index)
+
+                        # The only stat() per file; size and date both come from it
+                        try:
+                            st = entry.stat()
+                        except OSError as e:
+                            # One unreadable file (or dangling symlink) shouldn't abort the scan
+                            logging.warning(f"Skipping {entry.path}: {e}")
+                            continue
 
                         file_info = ReprocessingFileInfo(
-                            filepath=str(file_path),
+                            filepath=entry.path,
                             filename=filename,
                             subject=matching_subject,
-                            has_transcript=transcript_path.exists(),
-                            has_notes=notes_path.exists(),
-                            transcript_path=str(transcript_path) if transcript_path.exists() else "",
-                            notes_path=str(notes_path) if notes_path.exists() else "",
-                            file_size=file_path.stat().st_size,
-                            modified_date=datetime.fromtimestamp(file_path.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
+                            has_transcript=has_transcript,
+                            has_notes=has_notes,
+                            transcript_path=f"{transcripts_str}{sep}{transcript_name}" if has_transcript else "",
+                            notes_path=f"{notes_str}{sep}{notes_name}" if has_notes else "",
+                            file_size=st.st_size,
+                            modified_date=strftime("%Y-%m-%d %H:%M", localtime(st.st_mtime))
                         )
+                        # Formatted here, off the Tk thread, so inserting a row is just the Tcl call
+                        file_info.row_values = _reprocess_row_values(file_info)
+                        out.put(file_info)
+        except Exception as e:
+            out.put(e)
+            return
+        out.put(None)
 
-                        self.reprocessing_files[str(file_path)] = file_info
-                        self.insert_reprocess_item(file_info)
-                        found_files += 1
-
+    def _drain_scan_queue(self, scan_queue):
+        """Move queued scan results into the reprocessing list, a batch per tick."""
+        if scan_queue is not self._scan_queue:
+            # Superseded by a newer scan, which has its own drain loop
+            return
+        done = error = None
+        for _ in range(200):
+            try:
+                item = scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                done = True
+                break
+            if isinstance(item, Exception):
+                error = item
+                break
+            self.reprocessing_files[item.filepath] = item
+            self._reprocess_index[item.filepath] = len(self._reprocess_order)
+            self._reprocess_order.append(item.filepath)
+            self._reprocess_by_subject.setdefault(item.subject, []).append(item.filepath)
+
+        # Fill the first page as results arrive; the rest is added as the user scrolls
+        if self._reprocess_rendered < REPROCESS_PAGE_SIZE:
+            self.render_reprocess_page()
+        found_files = len(self._reprocess_order)
+
+        if error is not None:
+            messagebox.showerror("Error", f"Error scanning directory: {error}")
+            self.reprocess_status_var.set("Error during scan")
+        elif done:
             self.selection_count_var.set(f"Found {found_files} files")
             self.reprocess_status_var.set(f"Scan complete. Found {found_files} relevant files.")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Error scanning directory: {e}")
-            self.reprocess_status_var.set("Error during scan")
+        else:
+            self.reprocess_status_var.set(f"Scanning directory... {found_files} files found")
+            self.root.after(50, self._drain_scan_queue, scan_queue)
+
+    def render_reprocess_page(self):
+        """Add the next page of scanned files to the reprocessing tree."""
+        self._reprocess_page_pending = False
+        start = self._reprocess_rendered
+        end = min(start + REPROCESS_PAGE_SIZE, len(self._reprocess_order))
+        files = self.reprocessing_files
+        self.bulk_insert_reprocess([files[filepath] for filepath in self._reprocess_order[start:end]])
+        self._reprocess_rendered = end
+
+    def on_reprocess_tree_scroll(self, first, last):
+        """Update the scrollbar and load more rows when nearing the end of the tree."""
+        self.reprocess_scrollbar.set(first, last)
+        if (float(last) >= 0.9 and not self._reprocess_page_pending
+                and self._reprocess_rendered < len(self._reprocess_order)):
+            self._reprocess_page_pending = True
+            self.root.after_idle(self.render_reprocess_page)
 
     def insert_reprocess_item(self, file_info):
         """Insert item into reprocessing tree."""
-        size_mb = file_info.file_size / (1024 * 1024)
-        size_str = f"{size_mb:.1f} MB"
-
-        transcript_icon = "✓" if file_info.has_transcript else "✗"
-        notes_icon = "✓" if file_info.has_notes else "✗"
-
-        status = "Ready"
-        if file_info.has_transcript and file_info.has_notes:
-            status = "Completed"
-        elif file_info.has_transcript:
-            status = "Has Transcript Only"
-
-        self.reprocess_tree.insert("", tk.END, values=(
-            "☐",
-            file_info.filename,
-            file_info.subject,
-            size_str,
-            file_info.modified_date,
-            transcript_icon,
-            notes_icon,
-            status
-        ), tags=(file_info.filepath,))
+        self.bulk_insert_reprocess((file_info,))
+
+    def bulk_insert_reprocess(self, file_infos):
+        """Insert a batch of items into the reprocessing tree."""
+        insert = self.reprocess_tree.insert
+        end = tk.END
+        for file_info in file_infos:
+            filepath = file_info.filepath
+            row_values = file_info.row_values or _reprocess_row_values(file_info)
+            insert("", end, iid=filepath,
+                   values=("☑" if file_info.selected else "☐",) + row_values,
+                   tags=(filepath,))
 
     def on_reprocess_tree_click(self, event):
         """Handle click on reprocessing tree."""
@@ -1306,54 +1649,55 @@ Transcript to process:"""
 
     def toggle_reprocess_selection(self, item_id):
         """Toggle selection state of a file."""
-        tags = self.reprocess_tree.item(item_id, "tags")
-        if not tags:
-            return
-
-        filepath = tags[0]
-        if filepath in self.reprocessing_files:
-            file_info = self.reprocessing_files[filepath]
-            file_info.selected = not file_info.selected
-
-            # Update display
-            current_values = self.reprocess_tree.item(item_id, "values")
-            new_checkbox = "☑" if file_info.selected else "☐"
-            new_values = (new_checkbox,) + current_values[1:]
-            self.reprocess_tree.item(item_id, values=new_values)
+        # Row iids are the file paths, so no tag lookup is needed
+        file_info = self.reprocessing_files.get(item_id)
+        if file_info is not None:
+            self.set_reprocess_selected(file_info, not file_info.selected)
+            self.update_selection_count()
 
-            if file_info.selected:
-                self.selected_files.add(filepath)
-            else:
-                self.selected_files.discard(filepath)
+    def set_reprocess_selected(self, file_info: ReprocessingFileInfo, selected: bool):
+        """Set a scanned file's selection state and its checkbox, if its row is shown."""
+        if file_info.selected == selected:
+            return
+        file_info.selected = selected
+        self._selected_count += 1 if selected else -1
 
-            self.update_selection_count()
+        # Rows are rendered in scan order, so the index says whether this one is in the tree
+        if self._reprocess_index.get(file_info.filepath, self._reprocess_rendered) < self._reprocess_rendered:
+            self.reprocess_tree.set(file_info.filepath, "Select", "☑" if selected else "☐")
 
     def update_selection_count(self):
         """Update the selection count label."""
-        count = len(self.selected_files)
-        self.selection_count_var.set(f"{count} files selected")
+        self.selection_count_var.set(f"{self._selected_count} files selected")
 
     def select_all_files(self):
         """Select all files in the list."""
-        for item_id in self.reprocess_tree.get_children():
-            tags = self.reprocess_tree.item(item_id, "tags")
-            if tags:
-                filepath = tags[0]
-                if filepath in self.reprocessing_files:
-                    file_info = self.reprocessing_files[filepath]
-                    if not file_info.selected:
-                        self.toggle_reprocess_selection(item_id)
+        self._bulk_set_selected(True)
 
     def deselect_all_files(self):
         """Deselect all files in the list."""
-        for item_id in self.reprocess_tree.get_children():
-            tags = self.reprocess_tree.item(item_id, "tags")
-            if tags:
-                filepath = tags[0]
-                if filepath in self.reprocessing_files:
-                    file_info = self.reprocessing_files[filepath]
-                    if file_info.selected:
-                        self.toggle_reprocess_selection(item_id)
+        self._bulk_set_selected(False)
+
+    def _bulk_set_selected(self, select: bool):
+        """Set every scanned file's selection state, rewriting only the checkboxes that change."""
+        checkbox = "☑" if select else "☐"
+        tree_set = self.reprocess_tree.set
+        files = self.reprocessing_files
+        rendered = self._reprocess_rendered
+        for i, filepath in enumerate(self._reprocess_order):
+            file_info = files[filepath]
+            if file_info.selected != select:
+                file_info.selected = select
+                if i < rendered:
+                    tree_set(filepath, "Select", checkbox)
+
+        self._selected_count = len(files) if select else 0
+        self.update_selection_count()
+
+    def _selected_file_infos(self) -> List[ReprocessingFileInfo]:
+        """Selected scanned files, in scan order."""
+        files = self.reprocessing_files
+        return [files[filepath] for filepath in self._reprocess_order if files[filepath].selected]
 
     def select_by_subject(self):
         """Select files by subject."""
@@ -1368,8 +1712,8 @@ Transcript to process:"""
         listbox = tk.Listbox(subject_window)
         listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        for subject in self.config.subjects:
-            listbox.insert(tk.END, subject)
+        if self.config.subjects:
+            listbox.insert(tk.END, *self.config.subjects)
 
         def on_select():
             selection = listbox.curselection()
@@ -1377,14 +1721,10 @@ Transcript to process:"""
                 selected_subject = listbox.get(selection[0])
                 self.deselect_all_files()
 
-                for item_id in self.reprocess_tree.get_children():
-                    tags = self.reprocess_tree.item(item_id, "tags")
-                    if tags:
-                        filepath = tags[0]
-                        if filepath in self.reprocessing_files:
-                            file_info = self.reprocessing_files[filepath]
-                            if file_info.subject == selected_subject:
-                                self.toggle_reprocess_selection(item_id)
+                reprocessing_files = self.reprocessing_files
+                for filepath in self._reprocess_by_subject.get(selected_subject, ()):
+                    self.set_reprocess_selected(reprocessing_files[filepath], True)
+                self.update_selection_count()
                 subject_window.destroy()
 
         ttk.Button(subject_window, text="Select", command=on_select).pack(pady=10)
@@ -1392,68 +1732,71 @@ Transcript to process:"""
     def on_reprocess_tree_double_click(self, event):
         """Handle double click to open file info."""
         item_id = self.reprocess_tree.identify_row(event.y)
-        if item_id:
-            tags = self.reprocess_tree.item(item_id, "tags")
-            if tags:
-                filepath = tags[0]
-                if filepath in self.reprocessing_files:
-                    self.show_file_details(self.reprocessing_files[filepath])
+        file_info = self.reprocessing_files.get(item_id) if item_id else None
+        if file_info is not None:
+            self.show_file_details(file_info)
 
     def show_file_details(self, file_info: ReprocessingFileInfo):
         """Show details about a file."""
-        details = f"""File: {file_info.filename}
-Subject: {file_info.subject}
-Path: {file_info.filepath}
-Size: {file_info.file_size / (1024*1024):.2f} MB
-Modified: {file_info.modified_date}
-
-Transcript: {'Yes' if file_info.has_transcript else 'No'}
-Notes: {'Yes' if file_info.has_notes else 'No'}
-
-Transcript Path: {file_info.transcript_path if file_info.has_transcript else 'Not found'}
-Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
-"""
-        messagebox.showinfo("File Details", details)
+        fi = file_info
+        has_transcript, has_notes = fi.has_transcript, fi.has_notes
+        lines = (
+            f"File: {fi.filename}",
+            f"Subject: {fi.subject}",
+            f"Path: {fi.filepath}",
+            f"Size: {fi.file_size / (1024*1024):.2f} MB",
+            f"Modified: {fi.modified_date}",
+            "",
+            "Transcript: Yes" if has_transcript else "Transcript: No",
+            "Notes: Yes" if has_notes else "Notes: No",
+            "",
+            f"Transcript Path: {fi.transcript_path if has_transcript else 'Not found'}",
+            f"Notes Path: {fi.notes_path if has_notes else 'Not found'}",
+            "",
+        )
+        messagebox.showinfo("File Details", "\n".join(lines))
 
     def reprocess_selected_files(self):
         """Reprocess selected files."""
-        if not self.selected_files:
+        selected = self._selected_file_infos()
+        if not selected:
             messagebox.showwarning("Warning", "No files selected!")
             return
 
         reprocess_type = self.reprocess_type_var.get()
-        count = len(self.selected_files)
+        count = len(selected)
 
         if not messagebox.askyesno("Confirm", f"Reprocess {count} files ({reprocess_type})?"):
             return
 
-        for filepath in self.selected_files:
-            file_info = self.reprocessing_files[filepath]
-
-            task = ProcessingTask(
+        created_at = datetime.now().isoformat(sep=' ', timespec='seconds')
+        tasks = []
+        for file_info in selected:
+            tasks.append(ProcessingTask(
                 filepath=file_info.filepath,
                 subject=file_info.subject,
                 reprocess_type=reprocess_type,
                 transcript_path=file_info.transcript_path,
-                notes_path=file_info.notes_path
-            )
+                notes_path=file_info.notes_path,
+                created_at=created_at
+            ))
 
-            self.task_queue.put(task)
-            self.reprocess_status_var.set(f"Queued {count} files for reprocessing")
+        self.enqueue_many(tasks)
+        self.reprocess_status_var.set(f"Queued {count} files for reprocessing")
 
         try:
-            self.notebook.select(self.tasks_tree.master)
+            self.notebook.select(self._tab_frames["Processing Tasks"])
         except Exception:
             pass
 
     def handle_reprocessing_task(self, task: ProcessingTask):
         """Handle a reprocessing task."""
         try:
-            self.log_activity(f"Reprocessing {task.reprocess_type}: {Path(task.filepath).name}")
+            self.log_activity(f"Reprocessing {task.reprocess_type}: {task.name}")
 
             if task.reprocess_type in ["transcript", "both"]:
                 # Force transcription even if exists
-                task.status = "transcribing"
+                self._set_task_status(task, "transcribing")
                 # Logic same as process_task for transcription part
                 self.process_task(task) # This might be recursive but process_task checks reprocess_type
                 # Wait, process_task calls handle_reprocessing_task if reprocess_type is set. Infinite loop!
@@ -1467,7 +1810,7 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
                 if task.transcript_path and os.path.exists(task.transcript_path):
                     self.process_notes_only(task)
                 else:
-                    self.log_activity(f"Cannot reprocess notes: Transcript missing for {Path(task.filepath).name}")
+                    self.log_activity(f"Cannot reprocess notes: Transcript missing for {task.name}")
 
             elif task.reprocess_type == "both" or task.reprocess_type == "transcript":
                  # We need to clear reprocess_type to avoid loop and call process_task
@@ -1481,30 +1824,43 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
 
     def delete_selected_outputs(self):
         """Delete outputs for selected files."""
-        if not self.selected_files:
+        selected = self._selected_file_infos()
+        if not selected:
             return
 
         if not messagebox.askyesno("Confirm", "Delete transcripts and notes for selected files? Audio files will NOT be deleted."):
             return
 
-        deleted_count = 0
-        for filepath in self.selected_files:
-            file_info = self.reprocessing_files[filepath]
+        paths = []
+        for file_info in selected:
+            if file_info.has_transcript:
+                paths.append(file_info.transcript_path)
+            if file_info.has_notes:
+                paths.append(file_info.notes_path)
 
-            if file_info.has_transcript and os.path.exists(file_info.transcript_path):
-                try:
-                    os.remove(file_info.transcript_path)
-                    deleted_count += 1
-                except Exception as e:
-                    logging.error(f"Error deleting transcript: {e}")
+        if not paths:
+            self._on_outputs_deleted(0)
+            return
 
-            if file_info.has_notes and os.path.exists(file_info.notes_path):
-                try:
-                    os.remove(file_info.notes_path)
-                    deleted_count += 1
-                except Exception as e:
-                    logging.error(f"Error deleting notes: {e}")
+        def worker():
+            deleted_count = 0
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                futures = {pool.submit(os.remove, path): path for path in paths}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        deleted_count += 1
+                    except FileNotFoundError:
+                        pass
+                    except Exception as e:
+                        logging.error(f"Error deleting {futures[future]}: {e}")
+            self.root.after(0, self._on_outputs_deleted, deleted_count)
+
+        self.reprocess_status_var.set(f"Deleting {len(paths)} output files...")
+        threading.Thread(target=worker, daemon=True).start()
 
+    def _on_outputs_deleted(self, deleted_count: int):
+        """Report a finished delete_selected_outputs run and rescan."""
         messagebox.showinfo("Complete", f"Deleted {deleted_count} output files.")
         self.scan_reprocess_files() # Refresh
 
@@ -1524,43 +1880,82 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_msg = f"[{timestamp}] {message}"
 
+        with self._activity_lock:
+            # Until the Monitoring tab is built the lines just wait in the backlog
+            self._activity_backlog.append(log_msg)
+            schedule = self.activity_text is not None and not self._activity_flush_pending
+            if schedule:
+                self._activity_flush_pending = True
+        if schedule:
+            self.root.after(50, self._flush_activity_log)
+
+        logging.info(message)
+
+    def _flush_activity_log(self):
+        """Write every buffered activity line to the log widget in one insert."""
+        with self._activity_lock:
+            self._activity_flush_pending = False
+            lines = self._activity_backlog[:]
+            self._activity_backlog.clear()
+        if lines:
+            self._write_activity(lines)
+
+    def _write_activity(self, lines: List[str]):
         self.activity_text.config(state=tk.NORMAL)
-        self.activity_text.insert(tk.END, log_msg + "\n")
+        self.activity_text.insert(tk.END, "\n".join(lines) + "\n")
         self.activity_text.see(tk.END)
         self.activity_text.config(state=tk.DISABLED)
 
-        logging.info(message)
-
     def refresh_tasks_display(self):
-        """Refresh the tasks treeview."""
-        for item in self.tasks_tree.get_children():
-            self.tasks_tree.delete(item)
-
-        for filepath, task in self.tasks.items():
-            filename = Path(filepath).name
-            self.tasks_tree.insert("", tk.END, values=(
-                filename,
+        """Refresh the tasks treeview, writing only rows that were added or changed."""
+        tree = self.tasks_tree
+        row_values = self._task_row_values
+        # Snapshot: worker threads may add tasks while we iterate
+        tasks = list(self.tasks.items())
+
+        removed = row_values.keys() - {filepath for filepath, _ in tasks}
+        if removed:
+            tree.delete(*removed)
+            for filepath in removed:
+                del row_values[filepath]
+
+        for filepath, task in tasks:
+            values = (
+                task.name,
                 task.subject,
                 task.status,
                 task.created_at,
                 task.tokens_used,
                 task.error_message if task.error_message else ""
-            ))
+            )
+            old = row_values.get(filepath)
+            if old is None:
+                tree.insert("", tk.END, iid=filepath, values=values)
+            elif old != values:
+                tree.item(filepath, values=values)
+            else:
+                continue
+            row_values[filepath] = values
 
     def clear_completed_tasks(self):
         """Clear completed tasks from the list."""
-        completed = [k for k, v in self.tasks.items() if v.status == "completed"]
-        for k in completed:
-            del self.tasks[k]
+        with self._status_lock:
+            completed = self._tasks_by_status.pop("completed", {})
+        for task in completed.values():
+            # Reprocessing tasks and superseded tasks are bucketed but not listed
+            if self.tasks.get(task.filepath) is task:
+                del self.tasks[task.filepath]
         self.refresh_tasks_display()
 
     def retry_failed_tasks(self):
         """Retry failed tasks."""
-        failed = [v for k, v in self.tasks.items() if v.status == "error"]
+        with self._status_lock:
+            failed = [task for task in self._tasks_by_status.get("error", {}).values()
+                      if self.tasks.get(task.filepath) is task]
         for task in failed:
-            task.status = "queued"
+            self._set_task_status(task, "queued")
             task.error_message = ""
-            self.task_queue.put(task)
+            self.enqueue_task(task)
         self.refresh_tasks_display()
         if failed:
             self.log_activity(f"Retrying {len(failed)} failed tasks")
@@ -1576,14 +1971,14 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         # Try to find a subject folder or Appunti Completi
         if self.config.subjects:
             subject = self.config.subjects[0]
-            possible_path = Path("Appunti Completi") / subject
-            if possible_path.exists():
-                self.open_file_folder(str(possible_path))
-                return
-            
-            possible_path = Path(subject) / "Appunti Completi"
-            if possible_path.exists():
-                self.open_file_folder(str(possible_path))
+            folder = self._word_folder_cache.get(subject)
+            if folder is None:
+                for possible_path in (Path("Appunti Completi") / subject, Path(subject) / "Appunti Completi"):
+                    if possible_path.exists():
+                        folder = self._word_folder_cache[subject] = str(possible_path)
+                        break
+            if folder is not None:
+                self.open_file_folder(folder)
                 return
 
         # Fallback to current dir
@@ -1600,21 +1995,57 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             return
 
         self.word_status_var.set("Updating Word documents...")
-        self.root.update()
 
-        updated_count = 0
-        for subject in self.config.subjects:
+        subjects = self._subjects
+        word_manager = self.word_manager
+
+        def list_notes(subject):
+            # Need to find where markdown notes are. Assuming standard structure.
+            # One directory read per subject, same matches as glob("*.md")
+            normcase = os.path.normcase
             try:
-                # Need to find where markdown notes are. Assuming standard structure
-                notes_dir = Path(subject) / "notes"
-                if notes_dir.exists():
-                    # Scan for md files
-                    for md_file in notes_dir.glob("*.md"):
-                        self.word_manager.check_new_markdown_file(str(md_file), subject)
-                    updated_count += 1
-            except Exception as e:
-                logging.error(f"Error updating docs for {subject}: {e}")
+                with os.scandir(os.path.join(subject, "notes")) as entries:
+                    return [entry.path for entry in entries
+                            if normcase(entry.name).endswith(".md") and not entry.name.startswith(".")]
+            except (FileNotFoundError, NotADirectoryError):
+                return None
+
+        def update_subject(subject, md_files):
+            for md_file in md_files:
+                # The Word manager is shared with the processing workers
+                with self._word_lock:
+                    word_manager.check_new_markdown_file(md_file, subject)
+            self._subject_doc_cache.pop(subject, None)
+
+        def worker():
+            updated_count = 0
+            with ThreadPoolExecutor(max_workers=min(8, len(subjects))) as pool:
+                # Scan every subject's notes folder in parallel, feeding each into an update job
+                listings = {pool.submit(list_notes, subject): subject for subject in subjects}
+                updates = {}
+                for future in as_completed(listings):
+                    subject = listings[future]
+                    try:
+                        md_files = future.result()
+                    except Exception as e:
+                        logging.error(f"Error updating docs for {subject}: {e}")
+                        continue
+                    if md_files is not None:
+                        updates[pool.submit(update_subject, subject, md_files)] = subject
+
+                for future in as_completed(updates):
+                    try:
+                        future.result()
+                        updated_count += 1
+                    except Exception as e:
+                        logging.error(f"Error updating docs for {updates[future]}: {e}")
+
+            self.root.after(0, self._on_word_documents_updated, updated_count)
 
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_word_documents_updated(self, updated_count: int):
+        """Report a finished update_all_word_documents run."""
         self.word_status_var.set(f"Updated documents for {updated_count} subjects")
         messagebox.showinfo("Success", f"Updated Word documents for {updated_count} subjects")
 
@@ -1636,8 +2067,10 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         self.config.word_font_size = self.word_font_size_var.get()
         self.config.word_line_spacing = self.word_line_spacing_var.get()
         
-        for i, var in self.word_heading_vars.items():
-            setattr(self.config, f'word_heading{i}_size', var.get())
+        self.config.word_heading1_size = self.word_heading_vars[1].get()
+        self.config.word_heading2_size = self.word_heading_vars[2].get()
+        self.config.word_heading3_size = self.word_heading_vars[3].get()
+        self._word_folder_cache.clear()
 
         self.save_config()
         
@@ -1645,14 +2078,12 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         self.init_word_manager()
         messagebox.showinfo("Success", "Word configuration saved")
 
-    def update_line_spacing_label(self, *args):
-        self.word_line_spacing_label.config(text=f"{self.word_line_spacing_var.get():.2f}")
+    def update_line_spacing_label(self, value: str):
+        self._debounce("line_spacing_label", lambda: self.word_line_spacing_label.config(
+            text=f"{float(value):.2f}"))
 
     def open_file_folder(self, path):
         """Open file or folder in OS file explorer."""
-        import platform
-        import subprocess
-
         path_obj = Path(path)
         if path_obj.is_file():
             found_folder = path_obj.parent
@@ -1660,9 +2091,9 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             found_folder = path_obj
     
         try:
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 os.startfile(str(found_folder))
-            elif platform.system() == "Darwin":
+            elif _SYSTEM == "Darwin":
                 subprocess.run(["open", str(found_folder)])
             else:
                 subprocess.run(["xdg-open", str(found_folder)])
@@ -1675,9 +2106,22 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         if directory:
             self.watch_dir_var.set(directory)
 
-    def update_temperature_label(self, *args):
-        """Update temperature label."""
-        self.temp_label.config(text=f"{self.temperature_var.get():.1f}")
+    def update_temperature_label(self, value: str):
+        """Update temperature label from the Scale's command callback."""
+        self._debounce("temperature_label", lambda: self.temp_label.config(
+            text=f"{float(value):.1f}"))
+
+    def _debounce(self, key: str, callback, delay_ms: int = LABEL_DEBOUNCE_MS):
+        """Run callback once delay_ms after the last call made with the same key."""
+        pending = self._after_ids.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def run():
+            self._after_ids.pop(key, None)
+            callback()
+
+        self._after_ids[key] = self.root.after(delay_ms, run)
 
     def list_available_models(self):
         """List available OpenRouter models."""
@@ -1699,10 +2143,14 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
                 models_tree.column("ID", width=250)
                 models_tree.column("Name", width=300)
 
-                for model in models:
-                    model_id = model.get('id', 'Unknown')
-                    model_name = model.get('name', model_id)
-                    models_tree.insert("", tk.END, values=(model_id, model_name))
+                # Rows are built up front and inserted before the tree is packed,
+                # so nothing is laid out or drawn until the whole list is in
+                rows = [(model_id, model.get('name', model_id))
+                        for model in models
+                        for model_id in (model.get('id', 'Unknown'),)]
+                insert = models_tree.insert
+                for row in rows:
+                    insert("", tk.END, values=row)
 
                 scrollbar = ttk.Scrollbar(models_window, orient=tk.VERTICAL, command=models_tree.yview)
                 models_tree.configure(yscrollcommand=scrollbar.set)
@@ -1725,8 +2173,10 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
     def add_subject(self):
         """Add a new subject."""
         subject = self.subject_entry.get().strip()
-        if subject and subject not in self.config.subjects:
+        if subject and subject not in self._subjects_set:
             self.config.subjects.append(subject)
+            self._refresh_subjects()
+            self._word_folder_cache.clear()
             self.update_subjects_listbox()
             self.subject_entry.delete(0, tk.END)
             self.log_activity(f"Added subject: {subject}")
@@ -1738,6 +2188,8 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         if selection:
             subject = self.subjects_listbox.get(selection[0])
             self.config.subjects.remove(subject)
+            self._refresh_subjects()
+            self._word_folder_cache.clear()
 
             if subject in self.config.subject_colors:
                 del self.config.subject_colors[subject]
@@ -1746,11 +2198,16 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             self.log_activity(f"Removed subject: {subject}")
             self.refresh_color_assignments()
 
+    def _refresh_subjects(self):
+        """Rebuild the immutable views of config.subjects used for matching and lookups."""
+        self._subjects: Tuple[str, ...] = tuple(self.config.subjects)
+        self._subjects_set = frozenset(self._subjects)
+
     def update_subjects_listbox(self):
         """Update the subjects listbox."""
         self.subjects_listbox.delete(0, tk.END)
-        for subject in self.config.subjects:
-            self.subjects_listbox.insert(tk.END, subject)
+        if self.config.subjects:
+            self.subjects_listbox.insert(tk.END, *self.config.subjects)
 
     def save_configuration(self):
         """Save current configuration."""
@@ -1773,12 +2230,13 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         self.config.gemini_max_tokens = self.gemini_max_tokens_var.get()
         
         self.config.remove_thinking_tags = self.remove_thinking_var.get()
-        self.config.auto_apply_colors = self.auto_apply_colors_var.get()
+        if hasattr(self, "auto_apply_colors_var"):
+            self.config.auto_apply_colors = self.auto_apply_colors_var.get()
 
         self.save_config()
         messagebox.showinfo("Configuration", "Configuration saved successfully!")
 
-        if self.observer and self.observer.is_alive():
+        if self.is_monitoring():
             self.stop_file_monitoring()
             time.sleep(0.5)
             self.start_file_monitoring()
@@ -1788,11 +2246,30 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         key = self.read_api_key_file(file_path)
         var.set(key)
 
+    def load_api_keys_async(self, key_vars):
+        """Read (file, var) API key pairs off the Tk thread and fill each var once read."""
+        def fill(var: tk.StringVar, key: str):
+            # Don't clobber anything typed while the file was being read
+            if not var.get():
+                var.set(key)
+
+        def worker():
+            for file_path, var in key_vars:
+                key = self.read_api_key_file(file_path)
+                if key:
+                    self.root.after(0, fill, var, key)
+
+        threading.Thread(target=worker, daemon=True).start()
+
     def save_api_key(self, file_path: Path, api_key: str):
         """Save API key to file."""
         if self.write_api_key_file(file_path, api_key):
             messagebox.showinfo("Success", f"API key saved to {file_path.name}")
 
+    def _save_key_cb(self, file_path: Path, var: tk.StringVar):
+        """Save the key currently entered in var to file_path."""
+        self.save_api_key(file_path, var.get())
+
     def test_assemblyai_connection(self):
         """Test AssemblyAI connection."""
         api_key = self.assemblyai_key_var.get().strip()
@@ -1807,7 +2284,7 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             transcriber = AssemblyAITranscriber(config=config)
 
             self.api_status_var.set("AssemblyAI: Testing connection...")
-            self.root.update()
+            self.root.update_idletasks()
 
             if len(api_key) > 10:
                 self.api_status_var.set("AssemblyAI: ✓ API key format looks valid")
@@ -1839,7 +2316,7 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             processor = OpenRouterProcessor(api_key=api_key, config=note_config)
 
             self.api_status_var.set("OpenRouter: Testing connection...")
-            self.root.update()
+            self.root.update_idletasks()
 
             result = processor.test_connection()
 
@@ -1873,7 +2350,7 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             processor = GeminiProcessor(api_key=api_key, config=gemini_config)
 
             self.api_status_var.set("Gemini: Testing connection...")
-            self.root.update()
+            self.root.update_idletasks()
 
             result = processor.test_connection()
 
@@ -1900,29 +2377,80 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         prompt = self.read_pre_prompt()
         self.prompt_text.delete(1.0, tk.END)
         self.prompt_text.insert(1.0, prompt)
-        self.update_prompt_char_count()
+        self._do_update_prompt_char_count()
 
     def reset_pre_prompt(self):
         """Reset pre-prompt to default."""
         if messagebox.askyesno("Confirm Reset", "Are you sure you want to reset the pre-prompt to default?"):
             if self.pre_prompt_file.exists():
                 self.pre_prompt_file.unlink()
+            self._pre_prompt_cached = self._pre_prompt_stamp = None
 
             self.ensure_pre_prompt_file()
             self.reload_pre_prompt()
 
     def update_prompt_char_count(self, event=None):
-        """Update character count for pre-prompt."""
-        prompt = self.prompt_text.get(1.0, tk.END)
-        char_count = len(prompt.strip())
+        """Update character count for pre-prompt, coalescing bursts of keystrokes."""
+        self._debounce("prompt_char_count", self._do_update_prompt_char_count, 150)
+
+    def _do_update_prompt_char_count(self):
+        # Tk counts the characters itself, so the buffer is never copied into Python
+        counts = self.prompt_text.count("1.0", "end-1c", "chars")
+        char_count = counts[0] if counts else 0
         self.prompt_char_var.set(f"Characters: {char_count}")
 
-    def start_processing_thread(self):
-        """Start the background processing thread."""
-        if self.processing_thread is None or not self.processing_thread.is_alive():
-            self.processing_thread = NoteProcessingThread(self.task_queue, self)
-            self.processing_thread.start()
-            logging.info("Processing thread started")
+    def _set_task_status(self, task: ProcessingTask, status: str):
+        """Change a task's status, keeping the queued-task counter and status buckets in step."""
+        with self._status_lock:
+            was_queued = task.status.startswith("queued")
+            old_bucket = self._tasks_by_status.get(task.status)
+            if old_bucket:
+                old_bucket.pop(id(task), None)
+            self._tasks_by_status.setdefault(status, {})[id(task)] = task
+            task.status = status
+            self._queued_count += status.startswith("queued") - was_queued
+
+    def enqueue_task(self, task: ProcessingTask):
+        """Queue a task on its subject's worker, starting the worker if needed.
+
+        Tasks for one subject run in order (they append to the same combined
+        document); different subjects run in parallel. Once max_workers workers
+        exist, new subjects share an existing worker's queue.
+        """
+        with self._workers_lock:
+            task_queue = self._queue_for(task.subject)
+        task_queue.put(task)
+
+    def enqueue_many(self, tasks: List[ProcessingTask]):
+        """Queue a batch of tasks, taking each target queue's lock once for the whole batch."""
+        batches: Dict[int, Tuple[queue.Queue, List[ProcessingTask]]] = {}
+        with self._workers_lock:
+            for task in tasks:
+                task_queue = self._queue_for(task.subject)
+                batches.setdefault(id(task_queue), (task_queue, []))[1].append(task)
+
+        # Same bookkeeping as Queue.put, once per queue instead of once per task
+        for task_queue, batch in batches.values():
+            with task_queue.mutex:
+                task_queue.queue.extend(batch)
+                task_queue.unfinished_tasks += len(batch)
+                task_queue.not_empty.notify(len(batch))
+
+    def _queue_for(self, subject: str) -> queue.Queue:
+        """Return subject's task queue, starting a worker for it if allowed. Caller holds _workers_lock."""
+        task_queue = self._queues.get(subject)
+        if task_queue is None:
+            if len(self._workers) < max(1, self.config.max_workers):
+                task_queue = queue.Queue()
+                worker = NoteProcessingThread(task_queue, self)
+                self._workers[subject] = worker
+                worker.start()
+                logging.info(f"Processing thread started for {subject}")
+            else:
+                workers = list(self._workers.values())
+                task_queue = workers[len(self._queues) % len(workers)].task_queue
+            self._queues[subject] = task_queue
+        return task_queue
 
     def start_file_monitoring(self):
         """Start file monitoring."""
@@ -1947,15 +2475,22 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
              return
 
         try:
-            if self.observer:
+            if self.is_monitoring():
                 self.stop_file_monitoring()
 
-            self.scan_existing_files()
-
-            self.observer = Observer()
-            event_handler = AudioFileHandler(self)
-            self.observer.schedule(event_handler, self.config.watch_directory, recursive=False)
-            self.observer.start()
+            if self._settler_thread is None or not self._settler_thread.is_alive():
+                self._settler_thread = threading.Thread(target=self._settle_new_files, daemon=True)
+                self._settler_thread.start()
+
+            # A fresh event per watch thread: one that outlived stop's join timeout
+            # stays stopped instead of resuming alongside the new one
+            self._stop_evt = threading.Event()
+            self._watch_thread = threading.Thread(
+                target=self._watchfiles_loop,
+                args=(self.config.watch_directory, self._stop_evt),
+                daemon=True
+            )
+            self._watch_thread.start()
 
             self.log_activity(f"Started monitoring directory: {self.config.watch_directory}")
             logging.info(f"Started file monitoring: {self.config.watch_directory}")
@@ -1966,33 +2501,100 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             logging.error(f"Failed to start monitoring: {e}")
             self.update_gui()
 
+    def is_monitoring(self) -> bool:
+        """Return True while the watch thread is running."""
+        return self._watch_thread is not None and self._watch_thread.is_alive()
+
+    def _watchfiles_loop(self, directory: str, stop_evt: threading.Event):
+        """Scan existing files, then queue newly added audio files for the settler thread until stopped."""
+        # Runs here rather than on the Tk thread; finishes before watching starts
+        self.scan_existing_files()
+        self.update_gui()
+
+        ext_set, splitext, added = self._ext_set, os.path.splitext, Change.added
+
+        # Called for every change in the directory, so no Path object per event
+        def audio_added(change, path):
+            return change == added and splitext(path)[1].lower() in ext_set
+
+        try:
+            for changes in watch(directory, watch_filter=audio_added,
+                                 stop_event=stop_evt, recursive=False):
+                for _, path in changes:
+                    # Blocks only if 256 files are already waiting to settle
+                    self._new_file_queue.put(path)
+        except Exception as e:
+            logging.error(f"File monitoring stopped unexpectedly: {e}")
+
     def stop_file_monitoring(self):
         """Stop file monitoring."""
-        if self.observer and self.observer.is_alive():
-            self.observer.stop()
-            self.observer.join()
+        if self.is_monitoring():
+            self._stop_evt.set()
+            self._watch_thread.join(timeout=5)
             self.log_activity("Stopped file monitoring")
             logging.info("Stopped file monitoring")
 
         self.update_gui()
 
+    def _settle_new_files(self):
+        """Hand each queued file to handle_new_file once it has finished being written.
+
+        Every waiting file is tracked separately, so a slow copy doesn't hold up the
+        files queued behind it, and the watcher's queue is emptied promptly.
+        """
+        # path -> (last (size, mtime_ns), when that reading was first seen, when the file arrived)
+        pending: Dict[str, Tuple[Optional[Tuple[int, int]], float, float]] = {}
+        new_files = self._new_file_queue
+        while True:
+            try:
+                # Sleep until the next check is due, or indefinitely when nothing is waiting
+                path = new_files.get(timeout=SETTLE_POLL_SECONDS) if pending else new_files.get()
+                while True:
+                    now = time.monotonic()
+                    pending.setdefault(path, (None, now, now))
+                    new_files.task_done()
+                    path = new_files.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            for path, (last, since, arrived) in list(pending.items()):
+                try:
+                    try:
+                        st = os.stat(path)
+                        current = (st.st_size, st.st_mtime_ns)
+                    except FileNotFoundError:
+                        del pending[path]  # vanished before it settled
+                        continue
+                    except OSError as e:
+                        # e.g. still locked by the program copying it: count it as changing
+                        logging.debug(f"Cannot stat {path} yet: {e}")
+                        current = None
+
+                    if current is not None and current == last:
+                        if now - since >= SETTLE_QUIET_SECONDS:
+                            del pending[path]
+                            self.handle_new_file(path)
+                    elif now - arrived >= SETTLE_DEADLINE_SECONDS:
+                        del pending[path]
+                        self.log_activity(f"Gave up waiting for {os.path.basename(path)} to finish copying")
+                        logging.warning(f"{path} still changing after {SETTLE_DEADLINE_SECONDS} s, skipped")
+                    else:
+                        pending[path] = (current, now, arrived)
+                except Exception:
+                    # One bad file must not take down the only settler thread
+                    pending.pop(path, None)
+                    logging.exception(f"Error settling new file {path}")
+
     def handle_new_file(self, filepath):
         """Handle new file detection."""
         try:
             path = Path(filepath)
 
-            if path.suffix.lower() not in self.config.supported_extensions:
+            if path.suffix.lower() not in self._ext_set:
                 return
 
-            time.sleep(2)
-
-            filename = path.name.lower()
-            matching_subject = None
-
-            for subject in self.config.subjects:
-                if subject.lower() in filename:
-                    matching_subject = subject
-                    break
+            matching_subject = _match_subject(path.name, self._subjects)
 
             if not matching_subject:
                 self.log_activity(f"No matching subject found for: {path.name}")
@@ -2007,8 +2609,8 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             self.log_activity(f"Detected new file: {path.name} (Subject: {matching_subject})")
 
             if self.config.auto_process:
-                self.task_queue.put(task)
-                task.status = "queued"
+                self._set_task_status(task, "queued")
+                self.enqueue_task(task)
                 self.log_activity(f"Queued for processing: {path.name}")
 
         except Exception as e:
@@ -2023,69 +2625,76 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
         self.log_activity("Starting initial scan of existing files...")
 
         try:
-            watch_path = Path(self.config.watch_directory)
+            watch_root = os.path.normpath(self.config.watch_directory)
+            subjects = self._subjects
+            subject_dirs = {s: (Path(s) / "transcripts", Path(s) / "notes") for s in subjects}
+            # Output directories are listed once each, not stat()ed per file
+            dir_index: Dict[Path, frozenset] = {}
+            ext_set, splitext, normcase, sep = self._ext_set, os.path.splitext, os.path.normcase, os.sep
             found_files = 0
             processed_files = 0
             pending_files = 0
 
-            for file_path in watch_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.config.supported_extensions:
+            with os.scandir(watch_root) as entries:
+                for entry in entries:
+                    stem, ext = splitext(entry.name)
+                    try:
+                        if ext.lower() not in ext_set or not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
                     found_files += 1
+                    filename = entry.name
 
-                    filename = file_path.name.lower()
-                    matching_subject = None
-
-                    for subject in self.config.subjects:
-                        if subject.lower() in filename:
-                            matching_subject = subject
-                            break
+                    matching_subject = _match_subject(filename, subjects)
 
                     if not matching_subject:
-                        self.log_activity(f"No matching subject for: {file_path.name}")
+                        self.log_activity(f"No matching subject for: {filename}")
                         continue
 
-                    subject_dir = Path(matching_subject)
-                    transcripts_dir = subject_dir / "transcripts"
-                    notes_dir = subject_dir / "notes"
+                    transcripts_dir, notes_dir = subject_dirs[matching_subject]
 
-                    expected_transcript = transcripts_dir / f"{file_path.stem}.txt"
-                    expected_notes = notes_dir / f"{file_path.stem}_notes.md"
+                    transcript_name = f"{stem}.txt"
+                    notes_name = f"{stem}_notes.md"
+                    has_transcript = normcase(transcript_name) in _dir_entries(transcripts_dir, dir_index)
+                    has_notes = normcase(notes_name) in _dir_entries(notes_dir, dir_index)
 
-                    task_key = str(file_path)
+                    task_key = entry.path
 
                     if task_key in self.tasks:
                         continue
 
                     task = ProcessingTask(
-                        filepath=str(file_path),
+                        filepath=task_key,
                         subject=matching_subject
                     )
 
-                    if expected_notes.exists() and expected_transcript.exists():
-                        task.status = "completed"
-                        task.transcript_path = str(expected_transcript)
-                        task.notes_path = str(expected_notes)
+                    # Output paths are only built for files that have them
+                    if has_notes and has_transcript:
+                        self._set_task_status(task, "completed")
+                        task.transcript_path = f"{transcripts_dir}{sep}{transcript_name}"
+                        task.notes_path = f"{notes_dir}{sep}{notes_name}"
                         processed_files += 1
-                        self.log_activity(f"Already processed: {file_path.name}")
+                        self.log_activity(f"Already processed: {filename}")
 
-                    elif expected_transcript.exists():
-                        task.status = "transcript_only"
-                        task.transcript_path = str(expected_transcript)
+                    elif has_transcript:
+                        self._set_task_status(task, "transcript_only")
+                        task.transcript_path = f"{transcripts_dir}{sep}{transcript_name}"
                         pending_files += 1
-                        self.log_activity(f"Has transcript, needs notes: {file_path.name}")
+                        self.log_activity(f"Has transcript, needs notes: {filename}")
 
                         if self.config.auto_process:
-                            self.task_queue.put(task)
-                            task.status = "queued_notes"
+                            self._set_task_status(task, "queued_notes")
+                            self.enqueue_task(task)
 
                     else:
-                        task.status = "pending"
+                        self._set_task_status(task, "pending")
                         pending_files += 1
-                        self.log_activity(f"Needs processing: {file_path.name}")
+                        self.log_activity(f"Needs processing: {filename}")
 
                         if self.config.auto_process:
-                            self.task_queue.put(task)
-                            task.status = "queued"
+                            self._set_task_status(task, "queued")
+                            self.enqueue_task(task)
 
                     self.tasks[task_key] = task
 
@@ -2098,110 +2707,137 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
     def process_notes_only(self, task: ProcessingTask):
         """Process only notes generation for files that already have transcripts."""
         try:
-            task.status = "processing_notes"
+            self._set_task_status(task, "processing_notes")
 
-            subject_dir = Path(task.subject)
-            notes_dir = subject_dir / "notes"
-            notes_dir.mkdir(parents=True, exist_ok=True)
+            _, notes_dir = self._ensure_subject_dirs(task.subject)
 
             transcript_path = Path(task.transcript_path)
             notes_filename = f"{transcript_path.stem}_notes.md"
             notes_path = notes_dir / notes_filename
-            
-            # Determine providers to try
-            providers_to_try = []
-            if self.config.provider_mode == "Only OpenRouter":
-                providers_to_try.append("OpenRouter")
-            elif self.config.provider_mode == "Only Gemini":
-                providers_to_try.append("Gemini")
-            elif self.config.provider_mode == "Fallback Mode":
-                providers_to_try.append(self.config.primary_provider)
-                if self.config.secondary_provider != self.config.primary_provider:
-                    providers_to_try.append(self.config.secondary_provider)
-            else:
-                providers_to_try.append("OpenRouter")
 
-            notes_result = {"success": False, "error": "No provider configured"}
-            
-            for provider in providers_to_try:
-                try:
-                    self.log_activity(f"Generating notes using {provider}...")
-                    
-                    processor = None
-                    if provider == "OpenRouter":
-                        note_config = NoteProcessingConfig(
-                            model=self.config.openrouter_model,
-                            temperature=self.config.openrouter_temperature,
-                            max_tokens=self.config.openrouter_max_tokens,
-                            pre_prompt=self.read_pre_prompt()
-                        )
-                        processor = OpenRouterProcessor(config=note_config)
-                    elif provider == "Gemini":
-                        gemini_config = GeminiProcessingConfig(
-                            model=self.config.gemini_model,
-                            temperature=self.config.gemini_temperature,
-                            max_tokens=self.config.gemini_max_tokens,
-                            pre_prompt=self.read_pre_prompt()
-                        )
-                        processor = GeminiProcessor(config=gemini_config)
-                    
-                    if processor:
-                        notes_result = processor.process_transcript_file(
-                            transcript_path=task.transcript_path,
-                            output_path=str(notes_path),
-                            subject=task.subject
-                        )
-                    
-                    if notes_result['success']:
-                        self.log_activity(f"✓ Notes generated successfully with {provider}")
-                        break
-                    else:
-                        self.log_activity(f"✗ {provider} failed: {notes_result.get('error')}")
+            self._generate_notes(task, notes_path)
+
+        except Exception as e:
+            self._ensured_dirs.discard(task.subject)  # recreate the folders next time
+            self._set_task_status(task, "error")
+            task.error_message = str(e)
+            self.log_activity(f"Notes processing error: {task.name} - {e}")
+            logging.error(f"Notes processing error for {task.filepath}: {e}")
+
+    def _ensure_subject_dirs(self, subject: str) -> Tuple[Path, Path]:
+        """Return subject's (transcripts, notes) dirs, creating them the first time they're needed."""
+        subject_dir = Path(subject)
+        transcripts_dir, notes_dir = subject_dir / "transcripts", subject_dir / "notes"
+        if subject not in self._ensured_dirs:
+            transcripts_dir.mkdir(parents=True, exist_ok=True)
+            notes_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(subject)
+        return transcripts_dir, notes_dir
+
+    def _providers_to_try(self) -> Tuple[str, ...]:
+        """Note providers to attempt, in order, for the configured provider mode."""
+        mode = self.config.provider_mode
+        if mode == "Only Gemini":
+            return ("Gemini",)
+        if mode == "Fallback Mode":
+            primary, secondary = self.config.primary_provider, self.config.secondary_provider
+            return (primary,) if secondary == primary else (primary, secondary)
+        # "Only OpenRouter" and anything unrecognised
+        return ("OpenRouter",)
+
+    def _generate_notes(self, task: ProcessingTask, notes_path: Path):
+        """Generate notes for task's transcript into notes_path, trying each provider in turn.
+
+        Also strips thinking tags, updates the Word document, and sets the
+        task's final status.
+        """
+        notes_result = {"success": False, "error": "No provider configured"}
+        # Read once for every provider attempt
+        pre_prompt = self.read_pre_prompt()
+        
+        for provider in self._providers_to_try():
+            try:
+                self.log_activity(f"Generating notes using {provider}...")
                 
-                except Exception as e:
-                    self.log_activity(f"Error with {provider}: {e}")
-                    notes_result = {"success": False, "error": str(e)}
+                processor = None
+                if provider == "OpenRouter":
+                    note_config = NoteProcessingConfig(
+                        model=self.config.openrouter_model,
+                        temperature=self.config.openrouter_temperature,
+                        max_tokens=self.config.openrouter_max_tokens,
+                        pre_prompt=pre_prompt
+                    )
+                    processor = OpenRouterProcessor(config=note_config)
+                elif provider == "Gemini":
+                    gemini_config = GeminiProcessingConfig(
+                        model=self.config.gemini_model,
+                        temperature=self.config.gemini_temperature,
+                        max_tokens=self.config.gemini_max_tokens,
+                        pre_prompt=pre_prompt
+                    )
+                    processor = GeminiProcessor(config=gemini_config)
+                
+                if processor:
+                    notes_result = processor.process_transcript_file(
+                        transcript_path=task.transcript_path,
+                        output_path=str(notes_path),
+                        subject=task.subject
+                    )
+                
+                if notes_result['success']:
+                    self.log_activity(f"✓ Notes generated successfully with {provider}")
+                    break
+                else:
+                    self.log_activity(f"✗ {provider} failed: {notes_result.get('error')}")
+            
+            except Exception as e:
+                self.log_activity(f"Error with {provider}: {e}")
+                notes_result = {"success": False, "error": str(e)}
 
-            if notes_result['success'] and self.config.remove_thinking_tags:
-                try:
-                    with open(notes_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+        if notes_result['success'] and self.config.remove_thinking_tags:
+            try:
+                with open(notes_path, 'rb') as f:
+                    data = f.read()
 
-                    cleaned_content = self.remove_thinking_tags(content)
+                # Most notes have no tags: leave those files untouched
+                if _THINK_MARK_RE.search(data):
+                    cleaned, removed = _THINK_RE_B.subn(b'', data)
 
-                    with open(notes_path, 'w', encoding='utf-8') as f:
-                        f.write(cleaned_content)
+                    if removed:
+                        # Write alongside and swap in, so a failed write can't truncate the notes
+                        tmp_path = notes_path.with_name(notes_path.name + ".tmp")
+                        with open(tmp_path, 'wb') as f:
+                            f.write(cleaned)
+                        os.replace(tmp_path, notes_path)
 
-                    self.log_activity(f"Removed thinking tags from: {Path(task.filepath).name}")
-                except Exception as e:
-                    logging.error(f"Error removing thinking tags: {e}")
+                        self.log_activity(f"Removed thinking tags from: {task.name}")
+            except Exception as e:
+                logging.error(f"Error removing thinking tags: {e}")
 
-            if notes_result['success']:
-                task.notes_path = str(notes_path)
-                task.tokens_used = notes_result.get('tokens_used', 0)
-                task.status = "completed"
-                self.log_activity(f"Notes generation completed: {Path(task.filepath).name} ({task.tokens_used} tokens)")
+        if notes_result['success']:
+            task.notes_path = str(notes_path)
+            task.tokens_used = notes_result.get('tokens_used', 0)
+            self._set_task_status(task, "completed")
+            self.log_activity(f"Notes generation completed: {task.name} ({task.tokens_used} tokens)")
 
-                if (self.config.word_auto_update and self.word_manager and
-                    task.status == "completed" and task.notes_path):
-                    try:
+            if (self.config.word_auto_update and self.word_manager and
+                task.status == "completed" and task.notes_path):
+                try:
+                    with self._word_lock:
                         self.word_manager.check_new_markdown_file(task.notes_path, task.subject)
-                        self.log_activity(f"Word document updated for {task.subject}")
-
-                        if self.config.auto_apply_colors:
-                            self.apply_color_to_word_document(task.subject)
-                    except Exception as e:
-                        logging.error(f"Error updating Word document: {e}")
-            else:
-                task.status = "error"
-                task.error_message = notes_result.get('error', 'Unknown notes processing error')
-                self.log_activity(f"Notes processing failed: {Path(task.filepath).name} - {task.error_message}")
+                    # The document may have just been created, and its size has changed
+                    self._subject_doc_cache.pop(task.subject, None)
+                    self.log_activity(f"Word document updated for {task.subject}")
 
-        except Exception as e:
-            task.status = "error"
-            task.error_message = str(e)
-            self.log_activity(f"Notes processing error: {Path(task.filepath).name} - {e}")
-            logging.error(f"Notes processing error for {task.filepath}: {e}")
+                    if self.config.auto_apply_colors:
+                        self.apply_color_to_word_document(task.subject)
+                except Exception as e:
+                    logging.error(f"Error updating Word document: {e}")
+        else:
+            self._ensured_dirs.discard(task.subject)  # recreate the folders next time
+            self._set_task_status(task, "error")
+            task.error_message = notes_result.get('error', 'Unknown notes processing error')
+            self.log_activity(f"Notes processing failed: {task.name} - {task.error_message}")
 
     def process_task(self, task: ProcessingTask):
         """Process a single task."""
@@ -2211,18 +2847,14 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
                 return
 
             if task.status == "queued_notes" and task.transcript_path and Path(task.transcript_path).exists():
-                self.log_activity(f"Processing notes only: {Path(task.filepath).name}")
+                self.log_activity(f"Processing notes only: {task.name}")
                 self.process_notes_only(task)
                 return
 
-            task.status = "transcribing"
-            self.log_activity(f"Starting transcription: {Path(task.filepath).name}")
+            self._set_task_status(task, "transcribing")
+            self.log_activity(f"Starting transcription: {task.name}")
 
-            subject_dir = Path(task.subject)
-            transcripts_dir = subject_dir / "transcripts"
-            notes_dir = subject_dir / "notes"
-            transcripts_dir.mkdir(parents=True, exist_ok=True)
-            notes_dir.mkdir(parents=True, exist_ok=True)
+            transcripts_dir, notes_dir = self._ensure_subject_dirs(task.subject)
 
             transcription_config = TranscriptionConfig(
                 language_detection=True,
@@ -2242,148 +2874,46 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
 
             if result['success']:
                 task.transcript_path = next((f for f in result['output_files'] if f.endswith('.txt')), "")
-                task.status = "processing_notes"
-                self.log_activity(f"Transcription completed: {Path(task.filepath).name}")
-
-                # Determine providers to try
-                providers_to_try = []
-                if self.config.provider_mode == "Only OpenRouter":
-                    providers_to_try.append("OpenRouter")
-                elif self.config.provider_mode == "Only Gemini":
-                    providers_to_try.append("Gemini")
-                elif self.config.provider_mode == "Fallback Mode":
-                    providers_to_try.append(self.config.primary_provider)
-                    if self.config.secondary_provider != self.config.primary_provider:
-                        providers_to_try.append(self.config.secondary_provider)
-                else:
-                    providers_to_try.append("OpenRouter")
+                self._set_task_status(task, "processing_notes")
+                self.log_activity(f"Transcription completed: {task.name}")
 
-                notes_result = {"success": False, "error": "No provider configured"}
-                
-                # Setup paths
                 transcript_path = Path(task.transcript_path)
                 notes_filename = f"{transcript_path.stem}_notes.md"
-                notes_path = notes_dir / notes_filename
-
-                for provider in providers_to_try:
-                    try:
-                        self.log_activity(f"Generating notes using {provider}...")
-                        
-                        processor = None
-                        if provider == "OpenRouter":
-                            note_config = NoteProcessingConfig(
-                                model=self.config.openrouter_model,
-                                temperature=self.config.openrouter_temperature,
-                                max_tokens=self.config.openrouter_max_tokens,
-                                pre_prompt=self.read_pre_prompt()
-                            )
-                            processor = OpenRouterProcessor(config=note_config)
-                        elif provider == "Gemini":
-                            gemini_config = GeminiProcessingConfig(
-                                model=self.config.gemini_model,
-                                temperature=self.config.gemini_temperature,
-                                max_tokens=self.config.gemini_max_tokens,
-                                pre_prompt=self.read_pre_prompt()
-                            )
-                            processor = GeminiProcessor(config=gemini_config)
-                        
-                        if processor:
-                            notes_result = processor.process_transcript_file(
-                                transcript_path=task.transcript_path,
-                                output_path=str(notes_path),
-                                subject=task.subject
-                            )
-                        
-                        if notes_result['success']:
-                            self.log_activity(f"✓ Notes generated successfully with {provider}")
-                            break
-                        else:
-                            self.log_activity(f"✗ {provider} failed: {notes_result.get('error')}")
-                    
-                    except Exception as e:
-                        self.log_activity(f"Error with {provider}: {e}")
-                        notes_result = {"success": False, "error": str(e)}
-
-                if notes_result['success'] and self.config.remove_thinking_tags:
-                    try:
-                        with open(notes_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-
-                        cleaned_content = self.remove_thinking_tags(content)
-
-                        with open(notes_path, 'w', encoding='utf-8') as f:
-                            f.write(cleaned_content)
-
-                        self.log_activity(f"Removed thinking tags from: {Path(task.filepath).name}")
-                    except Exception as e:
-                        logging.error(f"Error removing thinking tags: {e}")
-
-                if notes_result['success']:
-                    task.notes_path = str(notes_path)
-                    task.tokens_used = notes_result.get('tokens_used', 0)
-                    task.status = "completed"
-                    self.log_activity(f"Notes generation completed: {Path(task.filepath).name} ({task.tokens_used} tokens)")
-
-                    if (self.config.word_auto_update and self.word_manager and
-                        task.status == "completed" and task.notes_path):
-                        try:
-                            self.word_manager.check_new_markdown_file(task.notes_path, task.subject)
-                            self.log_activity(f"Word document updated for {task.subject}")
-
-                            if self.config.auto_apply_colors:
-                                self.apply_color_to_word_document(task.subject)
-                        except Exception as e:
-                            logging.error(f"Error updating Word document: {e}")
-                else:
-                    task.status = "error"
-                    task.error_message = notes_result.get('error', 'Unknown notes processing error')
-                    self.log_activity(f"Notes processing failed: {Path(task.filepath).name} - {task.error_message}")
+                self._generate_notes(task, notes_dir / notes_filename)
 
             else:
-                task.status = "error"
+                self._ensured_dirs.discard(task.subject)  # recreate the folders next time
+                self._set_task_status(task, "error")
                 task.error_message = result.get('error', 'Unknown transcription error')
-                self.log_activity(f"Transcription failed: {Path(task.filepath).name} - {task.error_message}")
+                self.log_activity(f"Transcription failed: {task.name} - {task.error_message}")
 
         except Exception as e:
-            task.status = "error"
+            self._ensured_dirs.discard(task.subject)  # recreate the folders next time
+            self._set_task_status(task, "error")
             task.error_message = str(e)
-            self.log_activity(f"Error processing task {Path(task.filepath).name}: {e}")
+            self.log_activity(f"Error processing task {task.name}: {e}")
             logging.error(f"Processing error for {task.filepath}: {e}")
 
     def get_task_progress(self, task):
         """Get task progress description."""
-        if task.status == "completed":
+        status = task.status
+        text = _PROGRESS_TEXT.get(status)
+        if text is not None:
+            return text
+        if status == "completed":
             if task.reprocess_type:
                 return f"✓ Reprocessed ({task.reprocess_type})"
             return "✓ Complete - Notes generated"
-        elif task.status == "transcript_only":
-            return "📝 Has transcript, needs notes"
-        elif task.status == "queued_notes":
-            return "⏳ Queued for notes generation"
-        elif task.status == "queued_transcript":
-            return "⏳ Queued for transcript generation"
-        elif task.status == "error":
+        if status == "error":
             return f"✗ Error: {task.error_message[:40]}..."
-        elif task.status == "transcribing":
-            return "🎵 Transcribing audio..."
-        elif task.status == "processing_notes":
-            return "📝 Generating notes..."
-        elif task.status == "queued":
-            return "⏳ Queued for processing"
-        elif task.status == "pending":
-            return "⏳ Waiting to start"
-        else:
-            return f"Unknown: {task.status}"
+        return f"Unknown: {status}"
 
     def open_file_in_editor(self, filepath):
         """Open file in system default editor."""
-        import subprocess
-        import platform
-
         try:
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 os.startfile(filepath)
-            elif platform.system() == "Darwin":
+            elif _SYSTEM == "Darwin":
                 subprocess.run(["open", filepath])
             else:
                 subprocess.run(["xdg-open", filepath])
@@ -2391,39 +2921,15 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
             messagebox.showerror("Error", f"Could not open file: {e}")
 
     def refresh_reprocessing_display(self):
-        """Refresh the reprocessing files display."""
-        for item in self.reprocess_tree.get_children():
-            self.reprocess_tree.delete(item)
+        """Refresh the reprocessing files display, sorted by filename."""
+        self.reprocess_tree.delete(*self.reprocess_tree.get_children())
 
-        for file_info in sorted(self.reprocessing_files.values(), key=lambda f: f.filename):
-            status_parts = []
-            if file_info.has_transcript:
-                status_parts.append("Has transcript")
-            if file_info.has_notes:
-                status_parts.append("Has notes")
-
-            if not status_parts:
-                status = "Not processed"
-            else:
-                status = ", ".join(status_parts)
-
-            size_mb = file_info.file_size / (1024 * 1024)
-            size_str = f"{size_mb:.1f} MB" if size_mb > 1 else f"{file_info.file_size / 1024:.1f} KB"
-
-            select_indicator = "☑" if file_info.selected else "☐"
-            transcript_indicator = "✓" if file_info.has_transcript else "✗"
-            notes_indicator = "✓" if file_info.has_notes else "✗"
-
-            self.reprocess_tree.insert("", tk.END, values=(
-                select_indicator,
-                file_info.filename,
-                file_info.subject,
-                status,
-                size_str,
-                file_info.modified_date,
-                transcript_indicator,
-                notes_indicator
-            ), tags=(file_info.filepath,))
+        # Re-render through the paged, batched path so rows match insert_reprocess_item
+        files = self.reprocessing_files
+        self._reprocess_order = sorted(files, key=lambda filepath: files[filepath].filename)
+        self._reprocess_index = {filepath: i for i, filepath in enumerate(self._reprocess_order)}
+        self._reprocess_rendered = 0
+        self.render_reprocess_page()
 
     def run(self):
         """Run the application."""
@@ -2444,11 +2950,15 @@ Notes Path: {file_info.notes_path if file_info.has_notes else 'Not found'}
 
         self.stop_file_monitoring()
 
-        if self.processing_thread and self.processing_thread.is_alive():
-            self.processing_thread.stop()
-            self.processing_thread.join(timeout=5)
+        with self._workers_lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(timeout=5)
 
         self.save_config()
+        self._log_listener.stop()
 
 
 def main():
@@ -7,6 +7,7 @@ Handles communication with OpenRouter API for AI-powered note processing.
 import os
 import json
 import time
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -26,6 +27,48 @@ class NoteProcessingConfig:
     retry_delay: float = 1.0
 
 
+_BASE_SYSTEM_PROMPT = """You are an expert note-taking assistant for students. Your task is to convert lecture transcripts into well-structured, comprehensive study notes.
+
+Please transform the provided transcript into organized notes with these characteristics:
+- Create clear headings and subheadings using markdown format
+- Extract key concepts, definitions, and important facts
+- Organize information logically and hierarchically
+- Use bullet points and numbered lists where appropriate
+- Highlight important terms and concepts with **bold** or *italics*
+- Include examples and explanations provided in the lecture
+- Maintain academic tone and accuracy
+- Format for easy studying and review
+- Add a brief summary at the end
+
+Structure your response as:
+# [Lecture Topic/Title]
+
+## Key Concepts
+[Main concepts covered]
+
+## Detailed Notes
+[Organized content with proper hierarchy]
+
+## Important Definitions
+[Key terms and their definitions]
+
+## Examples
+[Any examples mentioned in the lecture]
+
+## Summary
+[Brief overview of the main points]"""
+
+
+@functools.lru_cache(maxsize=64)
+def _system_prompt(subject: str = "") -> str:
+    """Build the system prompt for a subject (cached, since it never changes)."""
+    if subject:
+        subject_addition = f"\n\nThis transcript is from a {subject} class, so focus on concepts and terminology relevant to that subject."
+        return _BASE_SYSTEM_PROMPT + subject_addition
+    
+    return _BASE_SYSTEM_PROMPT
+
+
 class OpenRouterProcessor:
     """Handles note processing using OpenRouter API."""
     
@@ -305,42 +348,7 @@ class OpenRouterProcessor:
     
     def _get_system_prompt(self, subject: str = "") -> str:
         """Get system prompt for note processing."""
-        base_prompt = """You are an expert note-taking assistant for students. Your task is to convert lecture transcripts into well-structured, comprehensive study notes.
-
-Please transform the provided transcript into organized notes with these characteristics:
-- Create clear headings and subheadings using markdown format
-- Extract key concepts, definitions, and important facts
-- Organize information logically and hierarchically
-- Use bullet points and numbered lists where appropriate
-- Highlight important terms and concepts with **bold** or *italics*
-- Include examples and explanations provided in the lecture
-- Maintain academic tone and accuracy
-- Format for easy studying and review
-- Add a brief summary at the end
-
-Structure your response as:
-# [Lecture Topic/Title]
-
-## Key Concepts
-[Main concepts covered]
-
-## Detailed Notes
-[Organized content with proper hierarchy]
-
-## Important Definitions
-[Key terms and their definitions]
-
-## Examples
-[Any examples mentioned in the lecture]
-
-## Summary
-[Brief overview of the main points]"""
-
-        if subject:
-            subject_addition = f"\n\nThis transcript is from a {subject} class, so focus on concepts and terminology relevant to that subject."
-            return base_prompt + subject_addition
-        
-        return base_prompt
+        return _system_prompt(subject)
     
     def _format_notes_output(self, notes: str, subject: str, filename: str, tokens_used: int, model: str) -> str:
         """Format the notes output with metadata."""